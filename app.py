@@ -6,6 +6,7 @@ import os
 import zipfile
 import tempfile
 from io import BytesIO
+from operator import itemgetter
 import logging
 import traceback
 import time
@@ -16,7 +17,7 @@ import plotly.graph_objects as go
 from pathlib import Path
 import asyncio
 import threading
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Final, List, Any, Optional, Tuple
 import sys
 import psutil
 
@@ -26,7 +27,7 @@ from latex_report_generator import LatexReportGenerator
 from template_processor import TemplateProcessor
 from pdf_generator import PDFGenerator
 from user_manual_generator import UserManualGenerator
-from database_manager import DatabaseManager
+from database_manager import DatabaseManager, BidderRow
 from excel_parser import ExcelParser
 from pdf_parser import PDFParser
 from utils import validate_percentage, format_currency, validate_nit_number
@@ -47,6 +48,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Document types offered on the PDF Reports tab
+DOC_TYPES: Final[Dict[str, Dict[str, str]]] = {
+    "comparative_statement": {
+        "name": "📊 Comparative Statement",
+        "description": "Detailed comparison of all bidders with statutory format",
+        "icon": "📊"
+    },
+    "letter_of_acceptance": {
+        "name": "✉️ Letter of Acceptance",
+        "description": "Official acceptance letter for the lowest bidder",
+        "icon": "✉️"
+    },
+    "scrutiny_sheet": {
+        "name": "🔍 Scrutiny Sheet",
+        "description": "Technical and financial evaluation sheet",
+        "icon": "🔍"
+    },
+    "work_order": {
+        "name": "📝 Work Order",
+        "description": "Official work order for project commencement",
+        "icon": "📝"
+    }
+}
+
+# Templates shown on the Template Management tab
+TEMPLATE_INFO: Final[Dict[str, Dict[str, str]]] = {
+    "comparative_statement.tex": {
+        "name": "📊 Comparative Statement",
+        "description": "Bidder comparison with statutory format"
+    },
+    "letter_of_acceptance.tex": {
+        "name": "✉️ Letter of Acceptance", 
+        "description": "Official acceptance letter template"
+    },
+    "scrutiny_sheet.tex": {
+        "name": "🔍 Scrutiny Sheet",
+        "description": "Technical evaluation template"
+    },
+    "work_order.tex": {
+        "name": "📝 Work Order",
+        "description": "Project commencement document"
+    }
+}
+
+# Characters in NIT numbers that are unsafe in output filenames
+NIT_FILENAME_TRANSLATION: Final[Dict[int, str]] = str.maketrans({'/': '_', '\\': '_', ':': '_', ' ': '_'})
+
+# User manual sections, stored as markdown files and read on demand
+MANUAL_SECTIONS: Final[Dict[str, str]] = {
+    "🚀 Getting Started": "docs/manual/getting_started.md",
+    "📊 Excel Format Guide": "docs/manual/excel_format.md",
+    "📝 Document Types": "docs/manual/doc_types.md",
+    "🔧 Troubleshooting": "docs/manual/troubleshooting.md"
+}
+
 # Configure Streamlit page
 st.set_page_config(
     page_title="TenderLatexPro - Enhanced",
@@ -75,6 +131,27 @@ def get_system_info() -> Dict[str, Any]:
         'streamlit_version': st.__version__
     }
 
+@st.cache_resource
+def get_database_manager() -> DatabaseManager:
+    """Shared DatabaseManager, so its SQLite connection is reused across reruns"""
+    return DatabaseManager()
+
+@st.cache_data(ttl=30)
+def _cached_bidder_statistics(_db_manager: DatabaseManager, version: int) -> Dict[str, Any]:
+    """Bidder statistics, cached until _db_manager.data_version changes or the TTL expires"""
+    return _db_manager.get_bidder_statistics()
+
+@st.cache_data(ttl=30)
+def _cached_recent_bidders(_db_manager: DatabaseManager, version: int, limit: int) -> List[BidderRow]:
+    """Recent bidders, cached until _db_manager.data_version changes or the TTL expires"""
+    return _db_manager.get_recent_bidders(limit)
+
+@st.cache_data
+def load_manual_section(path: str) -> str:
+    """Read a user manual section from disk"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
 def initialize_directories():
     """Initialize required directories"""
     directories = ['templates', 'outputs', 'temp', 'logs', 'cache', 'exports', 'backup']
@@ -139,7 +216,7 @@ def show_enhanced_dashboard():
     st.header("📈 Enhanced Dashboard Overview")
     
     # Initialize database manager
-    db_manager = DatabaseManager()
+    db_manager = get_database_manager()
     
     try:
         # Get comprehensive statistics
@@ -932,7 +1009,7 @@ def show_enhanced_bidder_management():
         "📤 Import/Export"
     ])
     
-    db_manager = DatabaseManager()
+    db_manager = get_database_manager()
     
     with tab1:
         show_bidders_list(db_manager)
@@ -1146,7 +1223,7 @@ def main():
 
     # Initialize components with error handling
     try:
-        db_manager = DatabaseManager()
+        db_manager = get_database_manager()
         tender_processor = TenderProcessor()
         latex_generator = LatexReportGenerator()
         template_processor = TemplateProcessor()
@@ -1693,74 +1770,74 @@ def handle_bidder_entry(db_manager, validator):
         st.session_state.current_bidders = {}
 
     bidders = []
+    suggested_names = [b.name for b in recent_bidders] if recent_bidders else []
     
-    # Enhanced bidder entry form
-    for i in range(int(num_bidders)):
-        st.markdown(f"#### 👤 Bidder {i+1}")
-        
-        col1, col2 = st.columns([3, 2])
-        
-        with col1:
-            # Bidder name with autocomplete suggestions
-            bidder_key = f"bidder_{i}_name"
-            suggested_names = [b['name'] for b in recent_bidders] if recent_bidders else []
+    # Enhanced bidder entry form; edits are applied together on submit
+    with st.form("bidders_form", clear_on_submit=False):
+        for i in range(int(num_bidders)):
+            st.markdown(f"#### 👤 Bidder {i+1}")
             
-            name = st.text_input(
-                f"Bidder Name *",
-                key=bidder_key,
-                placeholder="Enter bidder name",
-                help="Full legal name of the bidder"
-            )
+            col1, col2 = st.columns([3, 2])
             
-            # Show suggestions if available
-            if suggested_names and name:
-                matching = [n for n in suggested_names if name.lower() in n.lower()]
-                if matching:
+            with col1:
+                name = st.text_input(
+                    f"Bidder Name *",
+                    key=f"bidder_{i}_name",
+                    placeholder="Enter bidder name",
+                    help="Full legal name of the bidder"
+                )
+                
+                # Searchable list of recent bidders in place of live autocomplete
+                if suggested_names:
                     selected = st.selectbox(
                         "Quick Select:",
-                        [""] + matching[:5],
+                        [""] + suggested_names,
                         key=f"suggest_{i}",
-                        help="Select from recent bidders"
+                        help="Select from recent bidders (overrides the typed name)"
                     )
                     if selected:
-                        st.session_state[bidder_key] = selected
-                        st.rerun()
+                        name = selected
 
-        with col2:
-            percentage = st.number_input(
-                f"Bid Percentage",
-                key=f"bidder_{i}_percentage",
-                min_value=-50.0,
-                max_value=100.0,
-                value=0.0,
-                step=0.01,
-                format="%.2f",
-                help="Bid percentage (+ for above, - for below estimate)"
-            )
+            with col2:
+                percentage = st.number_input(
+                    f"Bid Percentage",
+                    key=f"bidder_{i}_percentage",
+                    min_value=-50.0,
+                    max_value=100.0,
+                    value=0.0,
+                    step=0.01,
+                    format="%.2f",
+                    help="Bid percentage (+ for above, - for below estimate)"
+                )
 
-        # Auto-calculate and display bid amount for validation
-        estimated_cost = st.session_state.tender_data.get('estimated_cost', 0)
-        calculated_amount = estimated_cost * (1 + percentage / 100) if estimated_cost > 0 else 0
-        
-        # Validation feedback for this bidder
-        if name and percentage is not None:
-            if percentage > 0:
-                st.success(f"✅ {percentage:.2f}% ABOVE estimate (₹{calculated_amount:,.2f})")
-            elif percentage < 0:
-                st.info(f"📉 {abs(percentage):.2f}% BELOW estimate (₹{calculated_amount:,.2f})")
-            else:
-                st.info(f"🎯 AT estimate (₹{calculated_amount:,.2f})")
-
-        # Add bidder to list if name is provided
-        if name:
-            bidders.append({
-                'name': name,
-                'percentage': percentage,
-                'bid_amount': calculated_amount,
-                'contact': ''  # Keep for compatibility with existing database structure
-            })
+            # Auto-calculate and display bid amount for validation
+            estimated_cost = st.session_state.tender_data.get('estimated_cost', 0)
+            calculated_amount = estimated_cost * (1 + percentage / 100) if estimated_cost > 0 else 0
+            
+            # Validation feedback for this bidder
+            if name and percentage is not None:
+                if percentage > 0:
+                    st.success(f"✅ {percentage:.2f}% ABOVE estimate (₹{calculated_amount:,.2f})")
+                elif percentage < 0:
+                    st.info(f"📉 {abs(percentage):.2f}% BELOW estimate (₹{calculated_amount:,.2f})")
+                else:
+                    st.info(f"🎯 AT estimate (₹{calculated_amount:,.2f})")
+
+            # Add bidder to list if name is provided
+            if name:
+                bidders.append({
+                    'name': name,
+                    'percentage': percentage,
+                    'bid_amount': calculated_amount,
+                    'contact': ''  # Keep for compatibility with existing database structure
+                })
 
-        st.markdown("---")
+            st.markdown("---")
+        
+        # Form widgets return their last-submitted values on every rerun, so
+        # bidders (and their amounts, from the current estimated cost) are
+        # rebuilt fresh each run
+        st.form_submit_button("👀 Update Preview", use_container_width=True)
 
     # Enhanced save functionality
     if bidders:
@@ -1770,9 +1847,8 @@ def handle_bidder_entry(db_manager, validator):
         with st.expander("👀 Preview Work Entry", expanded=True):
             # Summary metrics
             if bidders:
-                sorted_bidders = sorted(bidders, key=lambda x: x['bid_amount'])
-                lowest_bidder = sorted_bidders[0]
-                highest_bidder = sorted_bidders[-1]
+                lowest_bidder = min(bidders, key=itemgetter('bid_amount'))
+                highest_bidder = max(bidders, key=itemgetter('bid_amount'))
                 
                 col1, col2, col3 = st.columns(3)
                 with col1:
@@ -1786,18 +1862,31 @@ def handle_bidder_entry(db_manager, validator):
                     st.metric("📏 Bid Range", f"₹{format_currency(bid_range)}", 
                              f"{len(bidders)} bidders")
 
-                # Bidder table preview (simplified)
-                df = pd.DataFrame(bidders)
-                df = df.sort_values('bid_amount').reset_index(drop=True)
-                df.index += 1  # Start from 1
+                # Bidder table preview (simplified), rebuilt only when the inputs change
+                preview_sig = hash((
+                    tuple(b['name'] for b in bidders),
+                    tuple(b['percentage'] for b in bidders),
+                    st.session_state.tender_data.get('estimated_cost', 0)
+                ))
                 
-                # Format for display and select only relevant columns
-                display_df = df[['name', 'percentage', 'bid_amount']].copy()
-                display_df.columns = ['Bidder Name', 'Percentage', 'Bid Amount']
-                display_df.loc[:, 'Bid Amount'] = display_df['Bid Amount'].apply(lambda x: f"₹{format_currency(x)}")
-                display_df.loc[:, 'Percentage'] = display_df['Percentage'].apply(lambda x: f"{x:+.2f}%")
+                if st.session_state.get('preview_sig') == preview_sig and 'preview_df' in st.session_state:
+                    display_df = st.session_state.preview_df
+                else:
+                    df = pd.DataFrame(bidders)
+                    df = df.sort_values('bid_amount').reset_index(drop=True)
+                    df.index += 1  # Start from 1
+                    
+                    # Format for display and select only relevant columns
+                    display_df = df[['name', 'percentage', 'bid_amount']].copy()
+                    display_df.columns = ['Bidder Name', 'Percentage', 'Bid Amount']
+                    display_df.loc[:, 'Bid Amount'] = display_df['Bid Amount'].apply(lambda x: f"₹{format_currency(x)}")
+                    display_df.loc[:, 'Percentage'] = display_df['Percentage'].apply(lambda x: f"{x:+.2f}%")
+                    
+                    st.session_state.preview_sig = preview_sig
+                    st.session_state.preview_df = display_df
                 
-                st.dataframe(display_df, use_container_width=True)
+                # At most 20 bidders, so a static table is enough
+                st.table(display_df)
 
         # Save button with confirmation
         if st.button("💾 Save Work Entry", type="primary", use_container_width=True):
@@ -1807,11 +1896,11 @@ def handle_bidder_entry(db_manager, validator):
                 work_data['bidders'] = bidders
                 
                 # Find lowest bidder
-                sorted_bidders = sorted(bidders, key=lambda x: x['bid_amount'])
-                work_data['lowest_bidder'] = sorted_bidders[0] if sorted_bidders else None
+                work_data['lowest_bidder'] = min(bidders, key=itemgetter('bid_amount')) if bidders else None
                 
-                # Save to database
-                work_id = db_manager.save_work_data(work_data)
+                # Save to database; bidders are inserted as one batch
+                bidder_rows = [(b['name'], b['percentage'], b['bid_amount'], b['contact']) for b in bidders]
+                work_id = db_manager.save_work_data(work_data, bidder_rows=bidder_rows)
                 
                 if work_id:
                     # Add to session state
@@ -1838,7 +1927,7 @@ def handle_bidder_entry(db_manager, validator):
                     st.code(traceback.format_exc())
     
     else:
-        st.info("👆 Please enter at least one bidder to proceed.")
+        st.info("👆 Please enter at least one bidder and click Update Preview to proceed.")
 
 def handle_pdf_generation(latex_generator, pdf_generator, template_processor, validator):
     """Enhanced PDF generation functionality"""
@@ -1888,34 +1977,11 @@ def handle_pdf_generation(latex_generator, pdf_generator, template_processor, va
     # Document type selection with enhanced UI
     st.subheader("📄 Document Generation")
     
-    doc_types = {
-        "comparative_statement": {
-            "name": "📊 Comparative Statement",
-            "description": "Detailed comparison of all bidders with statutory format",
-            "icon": "📊"
-        },
-        "letter_of_acceptance": {
-            "name": "✉️ Letter of Acceptance",
-            "description": "Official acceptance letter for the lowest bidder",
-            "icon": "✉️"
-        },
-        "scrutiny_sheet": {
-            "name": "🔍 Scrutiny Sheet",
-            "description": "Technical and financial evaluation sheet",
-            "icon": "🔍"
-        },
-        "work_order": {
-            "name": "📝 Work Order",
-            "description": "Official work order for project commencement",
-            "icon": "📝"
-        }
-    }
-
     # Document type selection with cards
     selected_docs = []
     
     cols = st.columns(2)
-    for i, (doc_type, info) in enumerate(doc_types.items()):
+    for i, (doc_type, info) in enumerate(DOC_TYPES.items()):
         with cols[i % 2]:
             if st.checkbox(
                 f"{info['icon']} {info['name']}", 
@@ -1957,34 +2023,53 @@ def handle_pdf_generation(latex_generator, pdf_generator, template_processor, va
             status_text = st.empty()
             
             total_docs = len(selected_docs)
+            pdf_batch = []
+            safe_nit = selected_work.get('nit_number', 'unknown').translate(NIT_FILENAME_TRANSLATION)
             
             for i, doc_type in enumerate(selected_docs):
-                status_text.text(f"🔄 Generating {doc_types[doc_type]['name']}...")
+                status_text.text(f"🔄 Generating {DOC_TYPES[doc_type]['name']}...")
                 progress_bar.progress((i + 1) / total_docs)
                 
                 # Generate LaTeX content
                 latex_content = latex_generator.generate_document(doc_type, selected_work)
                 
                 if latex_content:
-                    filename_base = f"{doc_type}_{selected_work.get('nit_number', 'unknown').replace('/', '_')}"
+                    filename_base = f"{doc_type}_{safe_nit}"
                     
                     # Save LaTeX file
                     latex_filename = f"{filename_base}.tex"
                     with open(f"outputs/{latex_filename}", 'w', encoding='utf-8') as f:
                         f.write(latex_content)
                     
-                    generated_files[f"{doc_types[doc_type]['icon']} {doc_types[doc_type]['name']} (LaTeX)"] = f"outputs/{latex_filename}"
+                    generated_files[f"{DOC_TYPES[doc_type]['icon']} {DOC_TYPES[doc_type]['name']} (LaTeX)"] = f"outputs/{latex_filename}"
                     
-                    # Generate PDF if requested
+                    # Queue for PDF compilation if requested
                     if "PDF" in output_format:
-                        pdf_result = pdf_generator.generate_pdf(latex_content, filename_base)
-                        if pdf_result['success']:
-                            generated_files[f"{doc_types[doc_type]['icon']} {doc_types[doc_type]['name']} (PDF)"] = pdf_result['pdf_path']
-                        else:
-                            st.error(f"❌ PDF generation failed for {doc_type}: {pdf_result['error']}")
+                        pdf_batch.append((doc_type, latex_content, filename_base))
                 else:
                     st.error(f"❌ Failed to generate {doc_type}")
             
+            # Compile all queued documents in one batch
+            if pdf_batch:
+                status_text.text("🔄 Compiling PDF documents...")
+                progress_bar.progress(0)
+                compiled = []
+                
+                def _on_pdf_done(filename_base, result):
+                    compiled.append(filename_base)
+                    progress_bar.progress(len(compiled) / len(pdf_batch))
+                
+                pdf_results = pdf_generator.generate_pdfs(
+                    [(latex_content, filename_base) for _, latex_content, filename_base in pdf_batch],
+                    progress_callback=_on_pdf_done
+                )
+                for doc_type, _, filename_base in pdf_batch:
+                    pdf_result = pdf_results[filename_base]
+                    if pdf_result['success']:
+                        generated_files[f"{DOC_TYPES[doc_type]['icon']} {DOC_TYPES[doc_type]['name']} (PDF)"] = pdf_result['pdf_path']
+                    else:
+                        st.error(f"❌ PDF generation failed for {doc_type}: {pdf_result['error']}")
+            
             progress_bar.progress(1.0)
             status_text.text("✅ Generation completed!")
             
@@ -2029,28 +2114,9 @@ def handle_template_management(template_processor):
     # Template status overview
     st.subheader("📋 Template Status Overview")
     
-    template_info = {
-        "comparative_statement.tex": {
-            "name": "📊 Comparative Statement",
-            "description": "Bidder comparison with statutory format"
-        },
-        "letter_of_acceptance.tex": {
-            "name": "✉️ Letter of Acceptance", 
-            "description": "Official acceptance letter template"
-        },
-        "scrutiny_sheet.tex": {
-            "name": "🔍 Scrutiny Sheet",
-            "description": "Technical evaluation template"
-        },
-        "work_order.tex": {
-            "name": "📝 Work Order",
-            "description": "Project commencement document"
-        }
-    }
-    
     # Template status cards
     cols = st.columns(2)
-    for i, (template_file, info) in enumerate(template_info.items()):
+    for i, (template_file, info) in enumerate(TEMPLATE_INFO.items()):
         with cols[i % 2]:
             template_path = f"templates/{template_file}"
             
@@ -2074,8 +2140,8 @@ def handle_template_management(template_processor):
     
     selected_template = st.selectbox(
         "Select Template to Edit:",
-        list(template_info.keys()),
-        format_func=lambda x: template_info[x]['name']
+        list(TEMPLATE_INFO.keys()),
+        format_func=lambda x: TEMPLATE_INFO[x]['name']
     )
     
     template_path = f"templates/{selected_template}"
@@ -2084,7 +2150,7 @@ def handle_template_management(template_processor):
         with open(template_path, 'r', encoding='utf-8') as f:
             current_content = f.read()
         
-        st.info(f"📝 Editing: {template_info[selected_template]['name']}")
+        st.info(f"📝 Editing: {TEMPLATE_INFO[selected_template]['name']}")
         
         # Template editor with syntax highlighting
         edited_content = st.text_area(
@@ -2099,13 +2165,16 @@ def handle_template_management(template_processor):
         
         with col1:
             if st.button("💾 Save Changes", type="primary"):
-                try:
-                    with open(template_path, 'w', encoding='utf-8') as f:
-                        f.write(edited_content)
-                    st.success("✅ Template saved successfully!")
-                    st.balloons()
-                except Exception as e:
-                    st.error(f"❌ Error saving template: {str(e)}")
+                if edited_content == current_content:
+                    st.info("No changes to save.")
+                else:
+                    try:
+                        with open(template_path, 'w', encoding='utf-8') as f:
+                            f.write(edited_content)
+                        st.success("✅ Template saved successfully!")
+                        st.balloons()
+                    except Exception as e:
+                        st.error(f"❌ Error saving template: {str(e)}")
         
         with col2:
             if st.button("🔄 Reset to Default"):
@@ -2158,8 +2227,10 @@ def handle_bidder_management(db_manager):
     """Enhanced bidder management"""
     st.info("👥 Manage bidder profiles and view bidding history across all tenders.")
     
-    # Get bidder statistics
-    stats = db_manager.get_bidder_statistics()
+    # Get bidder statistics; the shared manager's data version changes on every
+    # write from any session, so cached entries never outlive a save
+    data_version = db_manager.data_version
+    stats = _cached_bidder_statistics(db_manager, data_version)
     
     # Statistics overview
     st.subheader("📊 Bidder Statistics")
@@ -2197,7 +2268,7 @@ def handle_bidder_management(db_manager):
         st.subheader("📋 Registered Bidders")
         
         # Get recent bidders
-        recent_bidders = db_manager.get_recent_bidders(50)
+        recent_bidders = _cached_recent_bidders(db_manager, data_version, 50)
         
         if recent_bidders:
             # Convert to DataFrame for better display
@@ -2209,8 +2280,8 @@ def handle_bidder_management(db_manager):
                 'last_used': 'Last Activity'
             })
             
-            # Format dates
-            df['Last Activity'] = pd.to_datetime(df['Last Activity']).dt.strftime('%Y-%m-%d')
+            # Format dates (last_used is stored as an ISO 8601 string, so the date is its prefix)
+            df['Last Activity'] = [str(x)[:10] if x else '' for x in df['Last Activity']]
             
             # Sort by participation count
             df = df.sort_values('Participation Count', ascending=False)
@@ -2266,119 +2337,15 @@ def handle_user_manual(manual_generator):
     """Enhanced user manual and help"""
     st.info("📖 Comprehensive guide for using the Enhanced Tender Processing System.")
     
-    # Manual sections
-    manual_sections = {
-        "🚀 Getting Started": """
-        ## Welcome to Enhanced Tender Processing System
-        
-        This system helps government departments process tenders efficiently with automated PDF generation.
-        
-        ### Quick Start Steps:
-        1. **📁 Data Input**: Upload Excel/PDF files or enter NIT details manually
-        2. **🏗️ Work Entry**: Add bidder information and percentages  
-        3. **📊 PDF Reports**: Generate statutory-compliant documents
-        4. **👥 Manage**: Track bidders and work entries
-        
-        ### System Features:
-        - ✅ Excel and PDF file parsing
-        - ✅ Automated bid amount calculations
-        - ✅ LaTeX-based PDF generation
-        - ✅ Statutory compliance formatting
-        - ✅ Bidder database management
-        """,
-        
-        "📊 Excel Format Guide": """
-        ## Excel File Format Requirements
-        
-        ### Required Columns:
-        - **NIT Number**: Format like "27/2024-25"
-        - **Work Name**: Detailed work description
-        - **Estimated Cost**: Numerical value in rupees
-        - **Schedule Amount**: Numerical value in rupees  
-        - **Earnest Money**: Security deposit amount
-        - **Time of Completion**: In months
-        - **EE Name**: Executive Engineer name
-        
-        ### Bidder Information Columns:
-        - **Bidder Name**: Full legal name
-        - **Percentage**: Bid percentage (+/- from estimate)
-        - **Contact**: Phone or email
-        
-        ### Sample Excel Structure:
-        ```
-        | NIT Number | Work Name | Estimated Cost | Bidder 1 Name | Bidder 1 % |
-        |------------|-----------|----------------|---------------|-------------|
-        | 27/2024-25 | Road Work | 1000000        | ABC Company   | -5.5        |
-        ```
-        """,
-        
-        "📝 Document Types": """
-        ## Available Document Types
-        
-        ### 📊 Comparative Statement
-        - Complete bidder comparison table
-        - Statutory format compliance
-        - Percentage calculations
-        - Ranking and analysis
-        
-        ### ✉️ Letter of Acceptance  
-        - Official acceptance letter
-        - Lowest bidder details
-        - Terms and conditions
-        - Signature blocks
-        
-        ### 🔍 Scrutiny Sheet
-        - Technical evaluation
-        - Financial assessment  
-        - Compliance checklist
-        - Recommendation section
-        
-        ### 📝 Work Order
-        - Project commencement document
-        - Scope of work
-        - Timeline and milestones
-        - Payment terms
-        """,
-        
-        "🔧 Troubleshooting": """
-        ## Common Issues & Solutions
-        
-        ### Excel Parsing Errors
-        - **Issue**: File not reading properly
-        - **Solution**: Ensure Excel file has proper headers and data format
-        - **Tip**: Save as .xlsx format for best compatibility
-        
-        ### LaTeX/PDF Generation
-        - **Issue**: PDF generation fails
-        - **Solution**: Check LaTeX installation status in sidebar
-        - **Command**: `sudo apt-get install texlive-latex-extra`
-        
-        ### Template Issues
-        - **Issue**: Missing template variables
-        - **Solution**: Use Template Manager to verify variables
-        - **Format**: Variables should be `{{variable_name}}`
-        
-        ### Database Problems
-        - **Issue**: Bidder data not saving
-        - **Solution**: Check database permissions and storage space
-        - **Reset**: Use "Clear Data" option in sidebar if needed
-        
-        ### Performance Issues
-        - **Issue**: Slow processing
-        - **Solution**: Process fewer documents at once
-        - **Tip**: Close unused browser tabs for better performance
-        """
-    }
-    
     # Section selection
     selected_section = st.selectbox(
         "📚 Choose Help Section:",
-        list(manual_sections.keys()),
+        list(MANUAL_SECTIONS.keys()),
         help="Select the topic you need help with"
     )
     
     # Display selected section
-    st.markdown(manual_sections[selected_section])
+    st.markdown(load_manual_section(MANUAL_SECTIONS[selected_section]))
     
     st.markdown("---")
     
@@ -2402,7 +2369,7 @@ def handle_user_manual(manual_generator):
     with col2:
         if st.button("💾 Download Manual", use_container_width=True):
             # Generate comprehensive manual
-            full_manual = "\n\n".join([f"# {title}\n{content}" for title, content in manual_sections.items()])
+            full_manual = "\n\n".join([f"# {title}\n{load_manual_section(path)}" for title, path in MANUAL_SECTIONS.items()])
             
             st.download_button(
                 "⬇️ Download PDF Manual",
@@ -1,6 +1,7 @@
 import json
 import os
 import logging
+from operator import itemgetter
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from date_utils import DateUtils
@@ -248,7 +249,7 @@ class BidderManager:
             name = bidder.get('name', '')
             bidder_counts[name] = bidder_counts.get(name, 0) + 1
         
-        most_common_bidder = max(bidder_counts.items(), key=lambda x: x[1])[0] if bidder_counts else None
+        most_common_bidder = max(bidder_counts.items(), key=itemgetter(1))[0] if bidder_counts else None
         
         # Date range
         dates = []
@@ -1,4 +1,5 @@
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, Any, List
 import logging
 from date_utils import DateUtils
@@ -96,7 +97,7 @@ class ComparativeStatementGenerator:
         """Generate official PWD comparative statement format with enhanced date handling."""
         
         # Sort bidders by bid amount (lowest first)
-        sorted_bidders = sorted(bidders, key=lambda x: x['bid_amount'])
+        sorted_bidders = sorted(bidders, key=itemgetter('bid_amount'))
         
         # Get work details with enhanced date parsing
         work_name = work['work_name']
@@ -1,16 +1,38 @@
 import streamlit as st
 import pandas as pd
 import os
+import subprocess
+import sys
 import tempfile
 from datetime import datetime
-import json
-import random
+from unittest import SkipTest
 
 from test_scenarios import test_scenarios
 from test_data_generator import test_data_gen
 from debug_logger import debug_logger
 from error_handler import error_handler
 from performance_monitor import perf_monitor
+from tender_processor import TenderProcessor
+
+# Leading bytes of .xlsx (zip container) and legacy .xls (OLE2) files
+EXCEL_SIGNATURES = (b'PK\x03\x04', b'\xD0\xCF\x11\xE0')
+
+# Memory limit check, run in a child process so the RLIMIT_AS cap never
+# applies to the Streamlit server. Exit 0: MemoryError raised under the cap;
+# 1: the allocation succeeded anyway.
+MEMORY_LIMIT_CHECK = '''
+import resource, sys
+limit = 256 * 1024 * 1024
+hard = resource.getrlimit(resource.RLIMIT_AS)[1]
+if hard != resource.RLIM_INFINITY:
+    limit = min(limit, hard)
+resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+try:
+    block = bytearray(1024 * 1024 * 1024)
+except MemoryError:
+    sys.exit(0)
+sys.exit(1)
+'''
 
 class ComprehensiveTester:
     """Main testing interface for TenderLatexPro"""
@@ -151,8 +173,11 @@ class ComprehensiveTester:
                 st.info(f"✅ Testing {percentile}th percentile selection")
                 
                 # Test document generation for each work
+                # (partition bidders by work once instead of filtering per work)
+                work_groups = dict(list(bidders_data.groupby('Work No.')))
+                no_bidders = bidders_data.iloc[0:0]
                 for work_no in range(1, num_works + 1):
-                    work_bidders = bidders_data[bidders_data['Work No.'] == work_no]
+                    work_bidders = work_groups.get(work_no, no_bidders)
                     st.info(f"✅ Work {work_no}: {len(work_bidders)} bidders processed")
                 
                 duration = perf_monitor.end_operation("Custom Scenario")
@@ -197,27 +222,56 @@ class ComprehensiveTester:
         
         results = []
         
+        # Generate the test data once, outside the timers, as processor input
+        works_data, bidders_data = test_data_gen.generate_nit_10_works_data()
+        work_groups = dict(list(bidders_data.groupby('Work No.')))
+        base_works = []
+        for work in works_data.to_dict('records'):
+            tender = {
+                'nit_number': work['NIT Number'],
+                'work_name': work['Work Description'],
+                'estimated_cost': work['Estimated Cost'],
+                'earnest_money': work['EMD Amount'],
+                'time_of_completion': work['Completion Period'].split()[0]
+            }
+            bidders = [
+                {'name': row['Name of Bidder'], 'bid_amount': row['Quoted Amount']}
+                for row in work_groups[work['Work No.']].to_dict('records')
+            ]
+            base_works.append((tender, bidders))
+        
+        processor = TenderProcessor()
+        
         for scenario_name, num_works, num_bidders in benchmark_scenarios:
             st.write(f"**Testing {scenario_name}**")
             
+            # Reuse the generated works and bidders cyclically to reach the scenario size
+            scenario_works = [
+                (tender, [bidders[j % len(bidders)] for j in range(num_bidders)])
+                for tender, bidders in (base_works[i % len(base_works)] for i in range(num_works))
+            ]
+            
+            scenario_tenders = pd.DataFrame([tender for tender, _ in scenario_works])
+            
             perf_monitor.start_operation(scenario_name)
             
             try:
-                # Simulate processing
-                works_data, bidders_data = test_data_gen.generate_nit_10_works_data()
+                # Process the scenario's tenders in one column-wise pass, then each work's bidders
+                processed = processor.process_tender_dataframe(scenario_tenders)
+                for estimated_cost, (_, bidders) in zip(processed['estimated_cost'], scenario_works):
+                    processor.process_bidder_data(bidders, estimated_cost)
                 
-                # Process subset based on scenario
                 processing_time = perf_monitor.end_operation(scenario_name)
                 
                 results.append({
                     'Scenario': scenario_name,
                     'Works': num_works,
                     'Bidders': num_bidders,
-                    'Time (s)': round(processing_time, 2),
+                    'Time (s)': round(processing_time, 4),
                     'Works/sec': round(num_works / processing_time, 2) if processing_time > 0 else 0
                 })
                 
-                st.success(f"✅ {scenario_name}: {processing_time:.2f}s")
+                st.success(f"✅ {scenario_name}: {processing_time:.4f}s")
                 
             except Exception as e:
                 st.error(f"❌ {scenario_name} failed: {str(e)}")
@@ -249,6 +303,8 @@ class ComprehensiveTester:
             try:
                 test_function()
                 st.success(f"✅ {test_name}: Error handled correctly")
+            except SkipTest as e:
+                st.warning(f"⏭️ {test_name}: Skipped - {str(e)}")
             except Exception as e:
                 st.info(f"ℹ️ {test_name}: Expected error occurred - {str(e)}")
     
@@ -260,6 +316,11 @@ class ComprehensiveTester:
             temp_file = f.name
         
         try:
+            # Reject on the file signature before handing it to an Excel reader
+            with open(temp_file, 'rb') as f:
+                header = f.read(8)
+            if not header.startswith(EXCEL_SIGNATURES):
+                raise ValueError("not an Excel file")
             df = pd.read_excel(temp_file)
         except Exception as e:
             # This should fail - that's expected
@@ -275,12 +336,10 @@ class ComprehensiveTester:
             'Date': ['not_a_date', None, 'invalid', '2024-13-45']
         })
         
-        # Try to process corrupted data
-        for col in corrupted_data.columns:
-            try:
-                pd.to_numeric(corrupted_data[col])
-            except:
-                pass  # Expected to fail
+        # Try to process corrupted data; bad values become NaN instead of raising
+        numeric_data = corrupted_data.apply(pd.to_numeric, errors='coerce')
+        invalid_columns = numeric_data.columns[numeric_data.isna().any()]
+        st.caption(f"Non-numeric values coerced in: {', '.join(invalid_columns)}")
     
     def test_missing_fields(self):
         """Test handling of missing required fields"""
@@ -305,13 +364,20 @@ class ComprehensiveTester:
             raise e
     
     def test_memory_limit(self):
-        """Test memory limit handling"""
-        try:
-            # Try to create very large dataset
-            large_data = list(range(1000000))  # Large but not too large
-            del large_data  # Clean up
-        except MemoryError as e:
-            raise e
+        """Test memory limit handling
+        
+        A child process caps its address space with setrlimit(RLIMIT_AS) and
+        must get a MemoryError from a 1 GB allocation.
+        """
+        if os.name != 'posix':
+            raise SkipTest("address-space limits need POSIX resource.setrlimit")
+        
+        result = subprocess.run([sys.executable, '-c', MEMORY_LIMIT_CHECK],
+                                capture_output=True, text=True, timeout=60)
+        if result.returncode == 1:
+            raise RuntimeError("1 GB allocation succeeded under a 256 MB RLIMIT_AS cap")
+        if result.returncode != 0:
+            raise RuntimeError(f"memory limit check failed: {result.stderr.strip()}")
     
     def display_testing_dashboard(self):
         """Display comprehensive testing dashboard"""
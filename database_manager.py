@@ -1,22 +1,186 @@
 import sqlite3
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Tuple, Iterator, NamedTuple
 import json
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Connection tuning applied once to the shared connection
+_CONNECTION_PRAGMAS = '''
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+'''
+
+# Hot statements, kept as constants so every call passes the same SQL text
+# and hits the connection's prepared-statement cache
+_SQL_CREATE_BIDDERS = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        work_id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        percentage REAL NOT NULL,
+        bid_amount REAL NOT NULL,
+        contact TEXT,
+        created_at TEXT NOT NULL,
+        FOREIGN KEY (work_id) REFERENCES works (id) ON DELETE CASCADE
+    )
+'''
+_BIDDER_COLUMNS = 'id, work_id, name, percentage, bid_amount, contact, created_at'
+_SQL_INSERT_WORK = '''
+    INSERT INTO works (
+        nit_number, work_name, estimated_cost, schedule_amount,
+        earnest_money, time_of_completion, ee_name, tender_date,
+        created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+# SQLite 3.35+ hands the new id back from the INSERT itself
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+_SQL_INSERT_WORK_RETURNING = _SQL_INSERT_WORK.rstrip() + ' RETURNING id\n'
+_SQL_UPDATE_WORK = '''
+    UPDATE works SET
+        nit_number = ?, work_name = ?, estimated_cost = ?,
+        schedule_amount = ?, earnest_money = ?, time_of_completion = ?,
+        ee_name = ?, tender_date = ?, updated_at = ?
+    WHERE id = ?
+'''
+_SQL_INSERT_BIDDER = '''
+    INSERT INTO bidders (
+        work_id, name, percentage, bid_amount, contact, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?)
+'''
+# The lowest bidder is derived as rank 1 rather than stored per row
+_SQL_SELECT_WORK_WITH_BIDDERS = '''
+    SELECT w.*, b.name, b.percentage, b.bid_amount, b.contact,
+           ROW_NUMBER() OVER (ORDER BY b.bid_amount, b.id) AS rnk
+    FROM works w
+    LEFT JOIN bidders b ON b.work_id = w.id
+    WHERE w.id = (
+        SELECT id FROM works WHERE nit_number = ?
+        ORDER BY created_at DESC LIMIT 1
+    )
+    ORDER BY rnk
+'''
+_SQL_BIDDER_STATISTICS = '''
+    WITH totals AS (
+        SELECT COUNT(DISTINCT name) AS total FROM bidder_profiles
+    ),
+    recent AS (
+        SELECT COUNT(*) AS recent FROM bidders
+        WHERE created_at >= date('now', '-30 days')
+    ),
+    frequent AS (
+        SELECT json_group_array(json_object('name', name, 'count', usage_count)) AS top
+        FROM (
+            SELECT name, usage_count FROM bidder_profiles
+            ORDER BY usage_count DESC LIMIT 10
+        )
+    )
+    SELECT totals.total, recent.recent, frequent.top FROM totals, recent, frequent
+'''
+_SQL_UPSERT_PROFILE = '''
+    INSERT INTO bidder_profiles (name, contact, last_used, usage_count)
+    VALUES (?, ?, ?, 1)
+    ON CONFLICT(name) DO UPDATE SET
+        contact = COALESCE(excluded.contact, bidder_profiles.contact),
+        last_used = excluded.last_used,
+        usage_count = bidder_profiles.usage_count + 1
+'''
+
+class BidderRow(NamedTuple):
+    """A bidder profile as returned by get_recent_bidders"""
+    name: str
+    contact: str
+    usage_count: int
+    last_used: Optional[str]
+
+
+class WorkRow(NamedTuple):
+    """A work summary as returned by get_all_works"""
+    id: int
+    nit_number: str
+    work_name: str
+    estimated_cost: float
+    schedule_amount: Optional[float]
+    earnest_money: Optional[float]
+    time_of_completion: Optional[int]
+    ee_name: Optional[str]
+    tender_date: Optional[str]
+    created_at: str
+    updated_at: str
+    bidder_count: int
+
+
 class DatabaseManager:
     """Enhanced database manager for tender processing system"""
     
     def __init__(self, db_path: str = "tender_bidders.db"):
         self.db_path = db_path
+        # One long-lived connection keeps SQLite's page cache warm between calls;
+        # Streamlit serves sessions from several threads, so access is serialized
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        self._conn.executescript(_CONNECTION_PRAGMAS)
+        # Rows are C-level mappings over the result; dicts are only built at the API boundary
+        self._conn.row_factory = sqlite3.Row
+        # Bumped on every committed write; callers use it as a cache key
+        self.data_version = 0
         self.init_database()
     
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield the shared connection; commits on success and rolls back on error
+        
+        Inside an open transaction() the connection is yielded as is, so a read
+        made in the middle of a batch neither commits nor rolls it back early.
+        """
+        with self._lock:
+            if self._conn.in_transaction:
+                yield self._conn
+            else:
+                with self._conn:
+                    yield self._conn
+    
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Yield a cursor inside one write transaction (BEGIN IMMEDIATE ... COMMIT)
+        
+        Pass the cursor as ``cursor=`` to save_work_data, update_work_data or
+        delete_work to batch several writes under a single commit, e.g. for
+        bulk imports::
+        
+            with db.transaction() as cur:
+                for work in works:
+                    db.save_work_data(work, cursor=cur)
+        
+        Any exception rolls the whole batch back. Every write method runs
+        through here, so data_version is bumped once per committed transaction.
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                yield cursor
+            except BaseException:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
+            self.data_version += 1
+    
+    def close(self):
+        """Close the shared database connection"""
+        with self._lock:
+            self._conn.close()
+    
     def init_database(self):
         """Initialize database with required tables"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Create works table
@@ -36,20 +200,9 @@ class DatabaseManager:
                     )
                 ''')
                 
-                # Create bidders table
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS bidders (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        work_id INTEGER NOT NULL,
-                        name TEXT NOT NULL,
-                        percentage REAL NOT NULL,
-                        bid_amount REAL NOT NULL,
-                        contact TEXT,
-                        is_lowest BOOLEAN DEFAULT 0,
-                        created_at TEXT NOT NULL,
-                        FOREIGN KEY (work_id) REFERENCES works (id)
-                    )
-                ''')
+                # Create bidders table; deleting a work removes its bidders
+                cursor.execute(_SQL_CREATE_BIDDERS.format(table='bidders'))
+                self._migrate_bidders_table(cursor)
                 
                 # Create bidder_profiles table for credential storage
                 cursor.execute('''
@@ -68,112 +221,128 @@ class DatabaseManager:
                 
                 # Create indexes for better performance
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_works_nit ON works(nit_number)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_bidders_work_id ON bidders(work_id)')
+                # (work_id, bid_amount) serves both work lookups and the lowest-bid-first ordering;
+                # it replaces the old single-column work_id index
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_bidders_work_bid ON bidders(work_id, bid_amount)')
+                cursor.execute('DROP INDEX IF EXISTS idx_bidders_work_id')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_bidders_name ON bidders(name)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_bidder_profiles_name ON bidder_profiles(name)')
+                # Covering index for get_recent_bidders: walked in order, stops at LIMIT
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_bidder_profiles_recent
+                    ON bidder_profiles(usage_count DESC, last_used DESC, name, contact)
+                ''')
                 
                 conn.commit()
                 logger.info("Database initialized successfully")
+            
+            # Enabled after any migration (the pragma is a no-op inside a transaction)
+            self._conn.execute('PRAGMA foreign_keys=ON')
                 
         except Exception as e:
-            logger.error(f"Error initializing database: {str(e)}")
+            logger.error("Error initializing database: %s", e)
             raise
     
-    def save_work_data(self, work_data: Dict[str, Any]) -> Optional[int]:
-        """Save work data with bidders to database"""
+    def _migrate_bidders_table(self, cursor):
+        """Rebuild a bidders table created with an older schema
+        
+        Older tables either did not cascade work deletes to bidders or still
+        stored the is_lowest flag, which is now derived at read time.
+        """
+        cursor.execute('PRAGMA foreign_key_list(bidders)')
+        cascades = all(row['on_delete'] == 'CASCADE' for row in cursor.fetchall())
+        cursor.execute('PRAGMA table_info(bidders)')
+        has_is_lowest = any(row['name'] == 'is_lowest' for row in cursor.fetchall())
+        if cascades and not has_is_lowest:
+            return
+        
+        cursor.execute(_SQL_CREATE_BIDDERS.format(table='bidders_new'))
+        cursor.execute(f'INSERT INTO bidders_new ({_BIDDER_COLUMNS}) SELECT {_BIDDER_COLUMNS} FROM bidders')
+        cursor.execute('DROP TABLE bidders')
+        cursor.execute('ALTER TABLE bidders_new RENAME TO bidders')
+        logger.info("Migrated bidders table to the current schema")
+    
+    def save_work_data(self, work_data: Dict[str, Any],
+                       bidder_rows: Optional[List[Tuple[str, float, float, str]]] = None,
+                       cursor: Optional[sqlite3.Cursor] = None) -> Optional[int]:
+        """Save work data with bidders to database
+
+        bidder_rows, if given, is a list of (name, percentage, bid_amount, contact)
+        tuples; otherwise they are built from work_data['bidders']. All bidders
+        are inserted with a single executemany call.
+        
+        With a cursor from transaction(), the write joins that transaction and
+        errors propagate so the caller's batch is rolled back.
+        """
+        if cursor is not None:
+            return self._save_work_data_in(cursor, work_data, bidder_rows)
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                current_time = datetime.now().isoformat()
-                
-                # Insert work data
-                cursor.execute('''
-                    INSERT INTO works (
-                        nit_number, work_name, estimated_cost, schedule_amount,
-                        earnest_money, time_of_completion, ee_name, tender_date,
-                        created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    work_data.get('nit_number'),
-                    work_data.get('work_name'),
-                    work_data.get('estimated_cost'),
-                    work_data.get('schedule_amount'),
-                    work_data.get('earnest_money'),
-                    work_data.get('time_of_completion'),
-                    work_data.get('ee_name'),
-                    work_data.get('date'),
-                    current_time,
-                    current_time
-                ))
-                
-                work_id = cursor.lastrowid
-                
-                # Insert bidders
-                bidders = work_data.get('bidders', [])
-                lowest_bidder = work_data.get('lowest_bidder', {})
-                
-                for bidder in bidders:
-                    is_lowest = (bidder.get('name') == lowest_bidder.get('name'))
-                    
-                    cursor.execute('''
-                        INSERT INTO bidders (
-                            work_id, name, percentage, bid_amount, contact, is_lowest, created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        work_id,
-                        bidder.get('name'),
-                        bidder.get('percentage'),
-                        bidder.get('bid_amount'),
-                        bidder.get('contact'),
-                        is_lowest,
-                        current_time
-                    ))
-                    
-                    # Update or insert bidder profile
-                    self._update_bidder_profile(cursor, bidder, current_time)
-                
-                conn.commit()
-                logger.info(f"Work data saved successfully with ID: {work_id}")
-                return work_id
+            with self.transaction() as cursor:
+                work_id = self._save_work_data_in(cursor, work_data, bidder_rows)
+            logger.info("Work data saved successfully with ID: %s", work_id)
+            return work_id
                 
         except Exception as e:
-            logger.error(f"Error saving work data: {str(e)}")
+            logger.error("Error saving work data: %s", e)
             return None
     
-    def _update_bidder_profile(self, cursor, bidder: Dict[str, Any], current_time: str):
-        """Update or insert bidder profile"""
+    def _save_work_data_in(self, cursor: sqlite3.Cursor, work_data: Dict[str, Any],
+                           bidder_rows: Optional[List[Tuple[str, float, float, str]]]) -> int:
+        """Insert a work, its bidders and their profiles using cursor"""
+        current_time = datetime.now().isoformat()
+        
+        # Insert work data
+        cursor.execute(_SQL_INSERT_WORK_RETURNING if _HAS_RETURNING else _SQL_INSERT_WORK, (
+            work_data.get('nit_number'),
+            work_data.get('work_name'),
+            work_data.get('estimated_cost'),
+            work_data.get('schedule_amount'),
+            work_data.get('earnest_money'),
+            work_data.get('time_of_completion'),
+            work_data.get('ee_name'),
+            work_data.get('date'),
+            current_time,
+            current_time
+        ))
+        
+        work_id = cursor.fetchone()[0] if _HAS_RETURNING else cursor.lastrowid
+        
+        # Insert bidders
+        if bidder_rows is None:
+            bidder_rows = [
+                (b.get('name'), b.get('percentage'), b.get('bid_amount'), b.get('contact'))
+                for b in work_data.get('bidders', [])
+            ]
+        cursor.executemany(_SQL_INSERT_BIDDER, [
+            (work_id, name, percentage, bid_amount, contact, current_time)
+            for name, percentage, bid_amount, contact in bidder_rows
+        ])
+        
+        # Update or insert bidder profiles
+        self._update_bidder_profiles(cursor, bidder_rows, current_time)
+        
+        return work_id
+    
+    def _update_bidder_profiles(self, cursor, bidder_rows: List[Tuple[str, float, float, str]],
+                                current_time: str):
+        """Update or insert the profiles for a batch of (name, percentage, bid_amount, contact) rows"""
         try:
-            bidder_name = bidder.get('name', '').strip()
-            if not bidder_name:
-                return
-            
-            # Check if profile exists
-            cursor.execute('SELECT id, usage_count FROM bidder_profiles WHERE name = ?', (bidder_name,))
-            result = cursor.fetchone()
-            
-            if result:
-                # Update existing profile
-                profile_id, usage_count = result
-                cursor.execute('''
-                    UPDATE bidder_profiles 
-                    SET contact = COALESCE(?, contact), last_used = ?, usage_count = ?
-                    WHERE id = ?
-                ''', (bidder.get('contact'), current_time, usage_count + 1, profile_id))
-            else:
-                # Insert new profile
-                cursor.execute('''
-                    INSERT INTO bidder_profiles (name, contact, last_used, usage_count)
-                    VALUES (?, ?, ?, 1)
-                ''', (bidder_name, bidder.get('contact'), current_time))
+            # One UPSERT per bidder: new names are inserted, known names bump
+            # usage_count and keep their contact unless a new one is given
+            cursor.executemany(_SQL_UPSERT_PROFILE, [
+                (name.strip(), contact, current_time)
+                for name, _, _, contact in bidder_rows
+                if name and name.strip()
+            ])
                 
         except Exception as e:
-            logger.error(f"Error updating bidder profile: {str(e)}")
+            logger.error("Error updating bidder profiles: %s", e)
     
-    def get_recent_bidders(self, limit: int = 50) -> List[Dict[str, Any]]:
+    def get_recent_bidders(self, limit: int = 50) -> List[BidderRow]:
         """Get recent bidders for auto-suggestion"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -183,64 +352,45 @@ class DatabaseManager:
                     LIMIT ?
                 ''', (limit,))
                 
-                results = cursor.fetchall()
-                
-                bidders = []
-                for result in results:
-                    bidders.append({
-                        'name': result[0],
-                        'contact': result[1] or '',
-                        'usage_count': result[2],
-                        'last_used': result[3]
-                    })
-                
-                return bidders
+                return [BidderRow(row[0], row[1] or '', row[2], row[3]) for row in cursor]
                 
         except Exception as e:
-            logger.error(f"Error fetching recent bidders: {str(e)}")
+            logger.error("Error fetching recent bidders: %s", e)
             return []
     
     def get_work_by_nit(self, nit_number: str) -> Optional[Dict[str, Any]]:
         """Get work data by NIT number"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
-                # Get work data
-                cursor.execute('''
-                    SELECT * FROM works WHERE nit_number = ?
-                    ORDER BY created_at DESC LIMIT 1
-                ''', (nit_number,))
-                
-                work_result = cursor.fetchone()
-                if not work_result:
+                # Latest work for the NIT joined with its bidders, lowest bid (rank 1) first
+                cursor.execute(_SQL_SELECT_WORK_WITH_BIDDERS, (nit_number,))
+                rows = cursor.fetchall()
+                if not rows:
                     return None
                 
-                # Convert to dictionary
-                work_columns = [desc[0] for desc in cursor.description]
-                work_data = dict(zip(work_columns, work_result))
-                
-                # Get bidders
-                cursor.execute('''
-                    SELECT name, percentage, bid_amount, contact, is_lowest
-                    FROM bidders WHERE work_id = ?
-                    ORDER BY bid_amount ASC
-                ''', (work_data['id'],))
+                # Work columns come first, followed by the five bidder columns
+                work_column_count = len(cursor.description) - 5
+                work_columns = rows[0].keys()[:work_column_count]
+                work_data = dict(zip(work_columns, rows[0][:work_column_count]))
                 
-                bidder_results = cursor.fetchall()
                 bidders = []
                 lowest_bidder = None
                 
-                for result in bidder_results:
+                for row in rows:
+                    name, percentage, bid_amount, contact, rnk = row[work_column_count:]
+                    if name is None:  # work without bidders
+                        continue
                     bidder = {
-                        'name': result[0],
-                        'percentage': result[1],
-                        'bid_amount': result[2],
-                        'contact': result[3] or ''
+                        'name': name,
+                        'percentage': percentage,
+                        'bid_amount': bid_amount,
+                        'contact': contact or ''
                     }
                     bidders.append(bidder)
                     
-                    if result[4]:  # is_lowest
+                    if rnk == 1:
                         lowest_bidder = bidder
                 
                 work_data['bidders'] = bidders
@@ -249,17 +399,21 @@ class DatabaseManager:
                 return work_data
                 
         except Exception as e:
-            logger.error(f"Error fetching work by NIT: {str(e)}")
+            logger.error("Error fetching work by NIT: %s", e)
             return None
     
-    def get_all_works(self, limit: int = 100) -> List[Dict[str, Any]]:
+    def get_all_works(self, limit: int = 100) -> List[WorkRow]:
         """Get all works with basic information"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
+                # Columns listed explicitly, in WorkRow field order
                 cursor.execute('''
-                    SELECT w.*, COUNT(b.id) as bidder_count
+                    SELECT w.id, w.nit_number, w.work_name, w.estimated_cost,
+                           w.schedule_amount, w.earnest_money, w.time_of_completion,
+                           w.ee_name, w.tender_date, w.created_at, w.updated_at,
+                           COUNT(b.id) as bidder_count
                     FROM works w
                     LEFT JOIN bidders b ON w.id = b.work_id
                     GROUP BY w.id
@@ -267,130 +421,102 @@ class DatabaseManager:
                     LIMIT ?
                 ''', (limit,))
                 
-                results = cursor.fetchall()
-                columns = [desc[0] for desc in cursor.description]
-                
-                works = []
-                for result in results:
-                    work = dict(zip(columns, result))
-                    works.append(work)
-                
-                return works
+                return [WorkRow(*row) for row in cursor]
                 
         except Exception as e:
-            logger.error(f"Error fetching all works: {str(e)}")
+            logger.error("Error fetching all works: %s", e)
             return []
     
     def get_bidder_statistics(self) -> Dict[str, Any]:
         """Get bidder statistics"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
-                # Total unique bidders
-                cursor.execute('SELECT COUNT(DISTINCT name) FROM bidder_profiles')
-                total_bidders = cursor.fetchone()[0]
-                
-                # Most frequent bidders
-                cursor.execute('''
-                    SELECT name, usage_count FROM bidder_profiles
-                    ORDER BY usage_count DESC LIMIT 10
-                ''')
-                frequent_bidders = cursor.fetchall()
-                
-                # Recent activity
-                cursor.execute('''
-                    SELECT COUNT(*) FROM bidders 
-                    WHERE created_at >= date('now', '-30 days')
-                ''')
-                recent_bids = cursor.fetchone()[0]
+                # Unique bidders, recent activity and the top 10 (as JSON) in one query
+                cursor.execute(_SQL_BIDDER_STATISTICS)
+                total_bidders, recent_bids, frequent_bidders = cursor.fetchone()
                 
                 return {
                     'total_unique_bidders': total_bidders,
-                    'frequent_bidders': [{'name': name, 'count': count} for name, count in frequent_bidders],
+                    'frequent_bidders': json.loads(frequent_bidders),
                     'recent_bids_30_days': recent_bids
                 }
                 
         except Exception as e:
-            logger.error(f"Error fetching bidder statistics: {str(e)}")
+            logger.error("Error fetching bidder statistics: %s", e)
             return {}
     
-    def delete_work(self, work_id: int) -> bool:
-        """Delete work and associated bidders"""
+    def delete_work(self, work_id: int, cursor: Optional[sqlite3.Cursor] = None) -> bool:
+        """Delete work and associated bidders
+        
+        With a cursor from transaction(), the delete joins that transaction and
+        errors propagate.
+        """
+        if cursor is not None:
+            self._delete_work_in(cursor, work_id)
+            return True
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Delete bidders first
-                cursor.execute('DELETE FROM bidders WHERE work_id = ?', (work_id,))
-                
-                # Delete work
-                cursor.execute('DELETE FROM works WHERE id = ?', (work_id,))
-                
-                conn.commit()
-                logger.info(f"Work {work_id} deleted successfully")
-                return True
+            with self.transaction() as cursor:
+                self._delete_work_in(cursor, work_id)
+            logger.info("Work %s deleted successfully", work_id)
+            return True
                 
         except Exception as e:
-            logger.error(f"Error deleting work {work_id}: {str(e)}")
+            logger.error("Error deleting work %s: %s", work_id, e)
             return False
     
-    def update_work_data(self, work_id: int, work_data: Dict[str, Any]) -> bool:
-        """Update existing work data"""
+    def _delete_work_in(self, cursor: sqlite3.Cursor, work_id: int):
+        """Delete a work using cursor"""
+        # Bidders are removed by the ON DELETE CASCADE foreign key
+        cursor.execute('DELETE FROM works WHERE id = ?', (work_id,))
+    
+    def update_work_data(self, work_id: int, work_data: Dict[str, Any],
+                         cursor: Optional[sqlite3.Cursor] = None) -> bool:
+        """Update existing work data
+        
+        With a cursor from transaction(), the update joins that transaction and
+        errors propagate.
+        """
+        if cursor is not None:
+            self._update_work_data_in(cursor, work_id, work_data)
+            return True
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                current_time = datetime.now().isoformat()
-                
-                # Update work data
-                cursor.execute('''
-                    UPDATE works SET
-                        nit_number = ?, work_name = ?, estimated_cost = ?,
-                        schedule_amount = ?, earnest_money = ?, time_of_completion = ?,
-                        ee_name = ?, tender_date = ?, updated_at = ?
-                    WHERE id = ?
-                ''', (
-                    work_data.get('nit_number'),
-                    work_data.get('work_name'),
-                    work_data.get('estimated_cost'),
-                    work_data.get('schedule_amount'),
-                    work_data.get('earnest_money'),
-                    work_data.get('time_of_completion'),
-                    work_data.get('ee_name'),
-                    work_data.get('date'),
-                    current_time,
-                    work_id
-                ))
-                
-                # Delete existing bidders
-                cursor.execute('DELETE FROM bidders WHERE work_id = ?', (work_id,))
-                
-                # Insert updated bidders
-                bidders = work_data.get('bidders', [])
-                lowest_bidder = work_data.get('lowest_bidder', {})
-                
-                for bidder in bidders:
-                    is_lowest = (bidder.get('name') == lowest_bidder.get('name'))
-                    
-                    cursor.execute('''
-                        INSERT INTO bidders (
-                            work_id, name, percentage, bid_amount, contact, is_lowest, created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        work_id,
-                        bidder.get('name'),
-                        bidder.get('percentage'),
-                        bidder.get('bid_amount'),
-                        bidder.get('contact'),
-                        is_lowest,
-                        current_time
-                    ))
-                
-                conn.commit()
-                logger.info(f"Work {work_id} updated successfully")
-                return True
+            with self.transaction() as cursor:
+                self._update_work_data_in(cursor, work_id, work_data)
+            logger.info("Work %s updated successfully", work_id)
+            return True
                 
         except Exception as e:
-            logger.error(f"Error updating work {work_id}: {str(e)}")
+            logger.error("Error updating work %s: %s", work_id, e)
             return False
+    
+    def _update_work_data_in(self, cursor: sqlite3.Cursor, work_id: int, work_data: Dict[str, Any]):
+        """Update a work and replace its bidders using cursor"""
+        current_time = datetime.now().isoformat()
+        
+        # Update work data
+        cursor.execute(_SQL_UPDATE_WORK, (
+            work_data.get('nit_number'),
+            work_data.get('work_name'),
+            work_data.get('estimated_cost'),
+            work_data.get('schedule_amount'),
+            work_data.get('earnest_money'),
+            work_data.get('time_of_completion'),
+            work_data.get('ee_name'),
+            work_data.get('date'),
+            current_time,
+            work_id
+        ))
+        
+        # Delete existing bidders
+        cursor.execute('DELETE FROM bidders WHERE work_id = ?', (work_id,))
+        
+        # Insert updated bidders in one batch
+        cursor.executemany(_SQL_INSERT_BIDDER, [
+            (work_id, b.get('name'), b.get('percentage'), b.get('bid_amount'),
+             b.get('contact'), current_time)
+            for b in work_data.get('bidders', [])
+        ])
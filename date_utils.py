@@ -1,40 +1,148 @@
+import calendar
 import logging
+import threading
+import time
 from datetime import datetime, date, timedelta
+from functools import lru_cache
 from typing import Union, Optional, Dict, Any
 import re
 
 logger = logging.getLogger(__name__)
 
+# Output formats
+_FMT_STATUTORY = '%d-%m-%y'  # 25-12-24
+_FMT_FULL = '%d-%m-%Y'        # 25-12-2024
+
+# Reasonable tender dates: at most 2 years back and 1 year ahead of today
+_TENDER_DATE_MIN_AGE = timedelta(days=730)
+_TENDER_DATE_MAX_LEAD = timedelta(days=365)
+
+# A date already in statutory DD-MM-YY form (zero-padded day and month)
+_STATUTORY_RE = re.compile(r'(0[1-9]|[12]\d|3[01])-(0[1-9]|1[0-2])-(\d{2})')
+
+# Day and month fields accepted by strptime's %d and %m
+_DAY = r'(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])'
+_MONTH = r'(1[0-2]|0[1-9]|[1-9])'
+
+# Supported input layouts: day-first with '-', '/' or '.' and a 4- or 2-digit
+# year (25-12-2024, 25/12/24, 25.12.2024), or year-first with '-' or '/'
+_DAY_FIRST_RE = re.compile(_DAY + r'([-/.])' + _MONTH + r'\2(\d{4}|\d{2})')
+_YEAR_FIRST_RE = re.compile(r'(\d{4})([-/])' + _MONTH + r'\2' + _DAY)
+
+# Input layouts recognised by get_date_validation_info and suggest_date_format.
+# Each is one alternation tried in priority order; the name of the branch that
+# matched (match.lastgroup) keys the result table.
+_DETECT_FORMAT_RE = re.compile(
+    r'(?P<dd_mm_yyyy>\d{2}-\d{2}-\d{4})'
+    r'|(?P<dd_slash_mm_yyyy>\d{2}/\d{2}/\d{4})'
+    r'|(?P<dd_mm_yy>\d{2}-\d{2}-\d{2})'
+)
+_DETECTED_FORMATS = {
+    'dd_mm_yyyy': 'DD-MM-YYYY',
+    'dd_slash_mm_yyyy': 'DD/MM/YYYY',
+    'dd_mm_yy': 'DD-MM-YY',
+}
+_SUGGEST_FORMAT_RE = re.compile(
+    r'(?P<day_first_full>\d{1,2}[/-]\d{1,2}[/-]\d{4})'
+    r'|(?P<year_first>\d{4}[/-]\d{1,2}[/-]\d{1,2})'
+    r'|(?P<day_first_short>\d{1,2}[/-]\d{1,2}[/-]\d{2})'
+)
+_FORMAT_SUGGESTIONS = {
+    'day_first_full': "Format detected. Use DD-MM-YYYY for best results",
+    'year_first': "Year-first format detected. Please use DD-MM-YYYY",
+    'day_first_short': "Two-digit year detected. Consider using DD-MM-YYYY",
+}
+
+# Per-thread (second, date) pair so batches of date checks share one clock read
+_today_cache = threading.local()
+
+def _today() -> date:
+    """Today's date, re-read from the clock at most once per second per thread"""
+    second = int(time.monotonic())
+    if getattr(_today_cache, 'second', None) != second:
+        _today_cache.value = datetime.now().date()
+        _today_cache.second = second
+    return _today_cache.value
+
+# _WORKING_DAY_OFFSETS[weekday][n]: calendar days to add for n (0-4) working
+# days past a whole number of weeks. Weekend starts count from the Friday
+# before (Saturday=5, Sunday=6 are skipped).
+_WORKING_DAY_OFFSETS = tuple(
+    tuple(
+        -max(weekday - 4, 0) + n + (2 if min(weekday, 4) + n > 4 else 0)
+        for n in range(5)
+    )
+    for weekday in range(7)
+)
+
+@lru_cache(maxsize=1024)
+def _parse_cleaned_date(cleaned_date: str) -> Optional[datetime]:
+    """Parse a stripped date string with one regex match (see DateUtils.parse_date_string)"""
+    match = _DAY_FIRST_RE.fullmatch(cleaned_date)
+    if match:
+        day, _, month, year = match.groups()
+        if len(year) == 2:
+            # strptime's %y pivot: 69-99 -> 1900s, 00-68 -> 2000s
+            year = int(year)
+            year += 1900 if year >= 69 else 2000
+    else:
+        match = _YEAR_FIRST_RE.fullmatch(cleaned_date)
+        if match:
+            year, _, month, day = match.groups()
+    
+    if match:
+        try:
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            pass
+    
+    logger.warning(f"Could not parse date string: {cleaned_date}")
+    return None
+
+
+@lru_cache(maxsize=2048)
+def _format_date_string(date_str: str, fmt: str) -> Optional[str]:
+    """Format a date string with fmt, or None if it cannot be parsed"""
+    parsed_date = DateUtils.parse_date_string(date_str)
+    return parsed_date.strftime(fmt) if parsed_date else None
+
+
+@lru_cache(maxsize=4)
+def _format_current_date(fmt: str, minute: int) -> str:
+    """Today's date formatted with fmt; minute (epoch minutes) keys the cache"""
+    return datetime.now().strftime(fmt)
+
+
 class DateUtils:
     """Enhanced date utilities for tender processing system"""
     
     @staticmethod
     def get_current_date_statutory() -> str:
         """Get current date in statutory format (DD-MM-YY)"""
-        return datetime.now().strftime('%d-%m-%y')
+        return _format_current_date(_FMT_STATUTORY, int(time.time() // 60))
     
     @staticmethod
     def get_current_date_full() -> str:
         """Get current date in full format (DD-MM-YYYY)"""
-        return datetime.now().strftime('%d-%m-%Y')
+        return _format_current_date(_FMT_FULL, int(time.time() // 60))
     
     @staticmethod
     def format_date_statutory(date_obj: Union[datetime, date, str]) -> str:
         """Format date in statutory format (DD-MM-YY)"""
         try:
-            if isinstance(date_obj, str):
-                # Try to parse string date
-                parsed_date = DateUtils.parse_date_string(date_obj)
-                if parsed_date:
-                    return parsed_date.strftime('%d-%m-%y')
-                else:
-                    return DateUtils.get_current_date_statutory()
-            
-            elif isinstance(date_obj, date):
-                return date_obj.strftime('%d-%m-%y')
+            # datetime is a subclass of date, so this covers both
+            if isinstance(date_obj, date):
+                return date_obj.strftime(_FMT_STATUTORY)
             
-            elif isinstance(date_obj, datetime):
-                return date_obj.strftime('%d-%m-%y')
+            elif isinstance(date_obj, str):
+                # Already DD-MM-YY with a day every month has: return as is
+                match = _STATUTORY_RE.fullmatch(date_obj)
+                if match and int(match.group(1)) <= 28:
+                    return date_obj
+                
+                # Try to parse string date
+                formatted = _format_date_string(date_obj, _FMT_STATUTORY)
+                return formatted or DateUtils.get_current_date_statutory()
             
             else:
                 logger.warning(f"Invalid date type: {type(date_obj)}")
@@ -48,18 +156,13 @@ class DateUtils:
     def format_date_full(date_obj: Union[datetime, date, str]) -> str:
         """Format date in full format (DD-MM-YYYY)"""
         try:
-            if isinstance(date_obj, str):
-                parsed_date = DateUtils.parse_date_string(date_obj)
-                if parsed_date:
-                    return parsed_date.strftime('%d-%m-%Y')
-                else:
-                    return DateUtils.get_current_date_full()
-            
-            elif isinstance(date_obj, date):
-                return date_obj.strftime('%d-%m-%Y')
+            # datetime is a subclass of date, so this covers both
+            if isinstance(date_obj, date):
+                return date_obj.strftime(_FMT_FULL)
             
-            elif isinstance(date_obj, datetime):
-                return date_obj.strftime('%d-%m-%Y')
+            elif isinstance(date_obj, str):
+                formatted = _format_date_string(date_obj, _FMT_FULL)
+                return formatted or DateUtils.get_current_date_full()
             
             else:
                 return DateUtils.get_current_date_full()
@@ -70,33 +173,17 @@ class DateUtils:
     
     @staticmethod
     def parse_date_string(date_str: str) -> Optional[datetime]:
-        """Parse date string in various formats"""
+        """Parse date string in various formats
+        
+        Accepts the same inputs as strptime with %d-%m-%Y, %d/%m/%Y, %d-%m-%y,
+        %d/%m/%y, %Y-%m-%d, %Y/%m/%d, %d.%m.%Y and %d.%m.%y. Results are
+        memoized per cleaned string.
+        """
         if not date_str:
             return None
         
-        # Common date formats
-        formats = [
-            '%d-%m-%Y',     # 25-12-2024
-            '%d/%m/%Y',     # 25/12/2024
-            '%d-%m-%y',     # 25-12-24
-            '%d/%m/%y',     # 25/12/24
-            '%Y-%m-%d',     # 2024-12-25
-            '%Y/%m/%d',     # 2024/12/25
-            '%d.%m.%Y',     # 25.12.2024
-            '%d.%m.%y',     # 25.12.24
-        ]
-        
         # Clean the input string
-        cleaned_date = str(date_str).strip()
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(cleaned_date, fmt)
-            except ValueError:
-                continue
-        
-        logger.warning(f"Could not parse date string: {date_str}")
-        return None
+        return _parse_cleaned_date(str(date_str).strip())
     
     @staticmethod
     def validate_date_format(date_str: str, format_str: str = "%d-%m-%Y") -> bool:
@@ -143,14 +230,14 @@ class DateUtils:
             else:
                 current_date = start_date
             
-            days_added = 0
-            while days_added < days:
-                current_date += timedelta(days=1)
-                # Skip weekends (Saturday=5, Sunday=6)
-                if current_date.weekday() < 5:
-                    days_added += 1
+            if days <= 0:
+                return current_date
             
-            return current_date
+            # Every 5 working days span exactly one calendar week; the
+            # remainder is a table lookup on the starting weekday
+            full_weeks, remainder = divmod(days, 5)
+            offset = _WORKING_DAY_OFFSETS[current_date.weekday()][remainder]
+            return current_date + timedelta(days=7 * full_weeks + offset)
             
         except Exception as e:
             logger.error(f"Error adding working days: {str(e)}")
@@ -190,32 +277,12 @@ class DateUtils:
             if isinstance(start_date, datetime):
                 start_date = start_date.date()
             
-            # Simple month addition (may need adjustment for edge cases)
-            year = start_date.year
-            month = start_date.month + months
-            day = start_date.day
-            
-            # Handle year overflow
-            while month > 12:
-                year += 1
-                month -= 12
-            
-            # Handle day overflow for months with different days
-            try:
-                completion_date = date(year, month, day)
-            except ValueError:
-                # Handle cases like Feb 30 -> last day of Feb
-                if month == 2:
-                    # Check for leap year
-                    if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
-                        completion_date = date(year, month, 29)
-                    else:
-                        completion_date = date(year, month, 28)
-                else:
-                    # For other months, use 30 days
-                    completion_date = date(year, month, 30)
-            
-            return completion_date
+            # Month arithmetic, clamping the day to the target month's length
+            year_offset, month_index = divmod(start_date.month - 1 + months, 12)
+            year = start_date.year + year_offset
+            month = month_index + 1
+            last_day = calendar.monthrange(year, month)[1]
+            return date(year, month, min(start_date.day, last_day))
             
         except Exception as e:
             logger.error(f"Error calculating completion date: {str(e)}")
@@ -260,15 +327,10 @@ class DateUtils:
             else:
                 return False
             
-            current_date = datetime.now().date()
-            
-            # Tender date should not be more than 2 years in the past
-            min_date = current_date - timedelta(days=730)
+            current_date = _today()
             
-            # Tender date should not be more than 1 year in the future
-            max_date = current_date + timedelta(days=365)
-            
-            return min_date <= check_date <= max_date
+            # Tender date should be within 2 years in the past and 1 year in the future
+            return current_date - _TENDER_DATE_MIN_AGE <= check_date <= current_date + _TENDER_DATE_MAX_LEAD
             
         except Exception as e:
             logger.error(f"Error validating tender date: {str(e)}")
@@ -301,14 +363,8 @@ class DateUtils:
                 result['formatted_full'] = DateUtils.format_date_full(parsed_date)
                 
                 # Determine format
-                if re.match(r'\d{2}-\d{2}-\d{4}', date_str):
-                    result['format_detected'] = 'DD-MM-YYYY'
-                elif re.match(r'\d{2}/\d{2}/\d{4}', date_str):
-                    result['format_detected'] = 'DD/MM/YYYY'
-                elif re.match(r'\d{2}-\d{2}-\d{2}', date_str):
-                    result['format_detected'] = 'DD-MM-YY'
-                else:
-                    result['format_detected'] = 'Auto-detected'
+                match = _DETECT_FORMAT_RE.match(date_str)
+                result['format_detected'] = _DETECTED_FORMATS[match.lastgroup] if match else 'Auto-detected'
                 
                 # Validate reasonableness
                 if not DateUtils.is_valid_tender_date(parsed_date):
@@ -332,11 +388,7 @@ class DateUtils:
             return "Please enter date in DD-MM-YYYY format"
         
         # Analyze the input pattern
-        if re.match(r'\d{1,2}[/-]\d{1,2}[/-]\d{4}', date_str):
-            return "Format detected. Use DD-MM-YYYY for best results"
-        elif re.match(r'\d{4}[/-]\d{1,2}[/-]\d{1,2}', date_str):
-            return "Year-first format detected. Please use DD-MM-YYYY"
-        elif re.match(r'\d{1,2}[/-]\d{1,2}[/-]\d{2}', date_str):
-            return "Two-digit year detected. Consider using DD-MM-YYYY"
-        else:
-            return "Please use DD-MM-YYYY format (e.g., 25-12-2024)"
+        match = _SUGGEST_FORMAT_RE.match(date_str)
+        if match:
+            return _FORMAT_SUGGESTIONS[match.lastgroup]
+        return "Please use DD-MM-YYYY format (e.g., 25-12-2024)"
@@ -1,92 +1,297 @@
+import atexit
+import collections
 import logging
+import queue
+import time
+from contextlib import contextmanager
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 import streamlit as st
 import traceback
 import sys
-from datetime import datetime
 import os
 
+# Shared by the file and console handlers across setup_logging calls
+_FMT = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Name given to the root QueueHandler so a reloaded module can find it
+_QUEUE_HANDLER_NAME = "TenderLatexPro.debug"
+
+try:
+    from streamlit.runtime import exists as _st_runtime_exists
+except ImportError:  # older Streamlit without the runtime check
+    def _st_runtime_exists():
+        return True
+
+def _tail_file(path, n=20, block=8192):
+    """Return the last n lines of path, reading backwards in blocks"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        pos = size
+        # Blocks are prepended and joined once instead of re-copying the buffer
+        blocks = collections.deque()
+        newlines = 0
+        # One extra newline so the first kept line is complete
+        while pos > 0 and newlines <= n:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            blocks.appendleft(chunk)
+            newlines += chunk.count(b'\n')
+    return b''.join(blocks).decode('utf-8', 'replace').splitlines()[-n:]
+
+
+class _BufferedFileHandler(RotatingFileHandler):
+    """Size-rotated log file opened on first emit, with a 64 KB write buffer
+    
+    Records are written without a flush each; _BatchMemoryHandler flushes
+    once per batch so a batch costs a single write syscall. The file size is
+    tracked in memory, so the rollover check needs no tell() or stat() per
+    record (plain FileHandler semantics; WatchedFileHandler's per-emit stat
+    is not needed since this process owns the rotation).
+    """
+    
+    def __init__(self, filename, max_bytes=5 * 1024 * 1024, backup_count=3, buffer_size=65536):
+        self.buffer_size = buffer_size
+        self._size = 0
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count,
+                         encoding='utf-8', delay=True)
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = stream.tell()
+        return stream
+    
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            msg = self.format(record) + self.terminator
+            if self._size and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._size += len(msg)
+        except Exception:
+            self.handleError(record)
+    
+    def truncate(self):
+        """Empty the current log file in place"""
+        with self.lock:
+            if self.stream is not None:
+                self.stream.seek(0)
+                self.stream.truncate()
+                self._size = 0
+            elif os.path.exists(self.baseFilename):
+                open(self.baseFilename, 'w').close()
+
+
+class _BatchMemoryHandler(MemoryHandler):
+    """MemoryHandler that flushes its target once after each batch"""
+    
+    def flush(self):
+        with self.lock:
+            super().flush()
+            if self.target:
+                self.target.flush()
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves all formatting to the listener thread
+    
+    The stock prepare() formats each record, traceback included, on the
+    calling thread so the record can be pickled; these records never leave
+    the process, so they are queued as they are.
+    """
+    
+    def prepare(self, record):
+        return record
+
+
 class DebugLogger:
     """Enhanced debug logging system for TenderLatexPro"""
     
     def __init__(self):
         self.log_file = "logs/debug.log"
+        self._logger = logging.getLogger("TenderLatexPro")
+        self._queue = queue.Queue(-1)
+        self._queue_handler = None
+        self._listener = None
+        self._mem = None
+        # ((mtime_ns, size), lines) of the last tail shown in the debug panel
+        self._panel_cache = (None, [])
         self.setup_logging()
+        atexit.register(self.stop_logging)
         
     def setup_logging(self):
         """Setup comprehensive logging configuration"""
         os.makedirs("logs", exist_ok=True)
         
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # Replace any previous listener so re-running setup does not stack handlers
+        self.stop_logging()
+        
+        # A module reload (e.g. Streamlit picking up a source change) creates a
+        # new DebugLogger; stop the old instance's listener thread and close its
+        # files instead of leaving them running behind a removed handler
+        logger = logging.getLogger()
+        for handler in logger.handlers[:]:
+            if handler.get_name() == _QUEUE_HANDLER_NAME:
+                owner = getattr(handler, 'owner', None)
+                if owner is not None:
+                    owner.stop_logging()
+                logger.removeHandler(handler)
         
         # File handler
-        file_handler = logging.FileHandler(self.log_file)
-        file_handler.setFormatter(formatter)
+        file_handler = _BufferedFileHandler(self.log_file)
+        file_handler.setFormatter(_FMT)
         file_handler.setLevel(logging.DEBUG)
         
+        # Buffer file writes; flushed as one block every 256 records or on ERROR
+        self._mem = _BatchMemoryHandler(
+            capacity=256, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+        )
+        self._mem.setLevel(logging.DEBUG)
+        
         # Console handler
         console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_FMT)
         console_handler.setLevel(logging.INFO)
         
-        # Root logger
-        logger = logging.getLogger()
+        # Root logger only enqueues records; a background listener does the
+        # file and console I/O off the calling thread
+        self._queue_handler = _DeferredQueueHandler(self._queue)
+        self._queue_handler.set_name(_QUEUE_HANDLER_NAME)
+        self._queue_handler.owner = self
         logger.setLevel(logging.DEBUG)
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        logger.addHandler(self._queue_handler)
+        
+        self._listener = QueueListener(
+            self._queue, self._mem, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+    
+    def stop_logging(self):
+        """Flush queued records, stop the listener and close its handlers"""
+        if self._listener is None:
+            return
+        logging.getLogger().removeHandler(self._queue_handler)
+        self._listener.stop()
+        file_handler = self._mem.target
+        for handler in self._listener.handlers:
+            handler.close()  # MemoryHandler flushes and drops its target here
+        file_handler.close()
+        self._listener = None
+        self._queue_handler = None
+        self._mem = None
+    
+    def flush(self):
+        """Write queued and buffered records to the log file"""
+        if self._mem is not None:
+            self._queue.join()  # wait for the listener to hand over queued records
+            self._mem.flush()
         
-    def log_function_entry(self, func_name, **kwargs):
-        """Log function entry with parameters"""
-        logging.info(f"ENTERING: {func_name} with params: {kwargs}")
+    def clear_logs(self):
+        """Empty the log file in place so the open handler keeps writing to it"""
+        if self._mem is None:
+            if os.path.exists(self.log_file):
+                open(self.log_file, 'w').close()
+            return
+        
+        self._queue.join()
+        with self._mem.lock:
+            self._mem.buffer.clear()
+            self._mem.target.truncate()
+        
+    def log_function_entry(self, func_name, verbose=False, **kwargs):
+        """Log function entry with parameter names and types
+        
+        Values are not repr'd (they may be whole DataFrames or PDF bytes);
+        pass verbose=True to also log them at DEBUG level.
+        """
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
+        self._logger.info("ENTERING: %s with params: %s", func_name,
+                          {k: type(v).__name__ for k, v in kwargs.items()})
+        if verbose:
+            self._logger.debug("ENTERING: %s with values: %s", func_name, kwargs)
         
     def log_function_exit(self, func_name, result=None):
         """Log function exit with result"""
-        logging.info(f"EXITING: {func_name} with result: {type(result)}")
+        self._logger.info("EXITING: %s with result: %s", func_name, type(result))
         
     def log_error(self, error, context=""):
         """Log detailed error information"""
         error_info = {
             'error_type': type(error).__name__,
             'error_message': str(error),
-            'context': context,
-            'traceback': traceback.format_exc(),
-            'timestamp': datetime.now().isoformat()
+            'context': context
         }
         
-        logging.error(f"ERROR: {error_info}")
+        # The traceback is formatted by the listener thread's handlers, not here
+        self._logger.error("ERROR: %s", error_info, exc_info=error)
         
-        # Also display in Streamlit if in debug mode
-        if hasattr(st.session_state, 'debug_mode') and st.session_state.debug_mode:
+        # Also count and display in Streamlit if in debug mode; headless runs
+        # (tests, batch jobs) have no session, so no traceback text is built here
+        if not _st_runtime_exists():
+            return
+        self.session_counters()['error'] += 1
+        if getattr(st.session_state, 'debug_mode', False):
+            tb = ''.join(traceback.format_exception(type(error), error, error.__traceback__))
             with st.expander(f"🐛 Debug Error: {error_info['error_type']}", expanded=False):
                 st.error(f"**Error:** {error_info['error_message']}")
                 st.text(f"**Context:** {error_info['context']}")
-                st.code(error_info['traceback'], language='python')
+                st.code(tb, language='python')
                 
     def log_warning(self, message, context=""):
         """Log warning with context"""
-        logging.warning(f"WARNING: {message} - Context: {context}")
+        self._logger.warning("WARNING: %s - Context: %s", message, context)
+        if _st_runtime_exists():
+            self.session_counters()['warning'] += 1
+    
+    def session_counters(self):
+        """Error and warning counts for the current Streamlit session"""
+        return st.session_state.setdefault('counters', {'error': 0, 'warning': 0})
         
     def log_performance(self, operation, duration, details=None):
         """Log performance metrics"""
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         perf_info = {
             'operation': operation,
             'duration_seconds': duration,
-            'details': details or {},
-            'timestamp': datetime.now().isoformat()
+            'details': details or {}
         }
-        logging.info(f"PERFORMANCE: {perf_info}")
+        self._logger.info("PERFORMANCE: %s", perf_info)
+        
+    @contextmanager
+    def timed(self, operation, **details):
+        """Time the enclosed block and log it via log_performance
+        
+        The clock is not read at all when INFO is filtered out::
+        
+            with debug_logger.timed("parse_excel", rows=len(df)):
+                parse(df)
+        """
+        if not self._logger.isEnabledFor(logging.INFO):
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.log_performance(operation, time.perf_counter() - start, details)
         
     def log_data_validation(self, data_type, validation_result, errors=None):
         """Log data validation results"""
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         validation_info = {
             'data_type': data_type,
             'valid': validation_result,
-            'errors': errors or [],
-            'timestamp': datetime.now().isoformat()
+            'errors': errors or []
         }
-        logging.info(f"VALIDATION: {validation_info}")
+        self._logger.info("VALIDATION: %s", validation_info)
         
     def display_debug_panel(self):
         """Display debug information panel in Streamlit"""
@@ -96,19 +301,27 @@ class DebugLogger:
                 st.subheader("🐛 Debug Panel")
                 
                 # Show recent logs
-                if os.path.exists(self.log_file):
-                    with open(self.log_file, 'r') as f:
-                        lines = f.readlines()
-                        recent_logs = lines[-20:] if len(lines) > 20 else lines
-                    
+                self.flush()
+                try:
+                    stat = os.stat(self.log_file)
+                except FileNotFoundError:
+                    recent_logs = None
+                else:
+                    # Only re-read the file when it changed since the last render
+                    version = (stat.st_mtime_ns, stat.st_size)
+                    cached_version, recent_logs = self._panel_cache
+                    if version != cached_version:
+                        recent_logs = _tail_file(self.log_file, 20)
+                        self._panel_cache = (version, recent_logs)
+                
+                if recent_logs is not None:
                     with st.expander("Recent Logs", expanded=False):
                         for line in recent_logs:
                             st.text(line.strip())
                 
                 # Clear logs button
                 if st.button("Clear Debug Logs"):
-                    if os.path.exists(self.log_file):
-                        os.remove(self.log_file)
+                    self.clear_logs()
                     st.success("Debug logs cleared!")
                     st.rerun()
 
@@ -4,6 +4,7 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml.shared import OxmlElement, qn
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, Any, List
 import io
 import logging
@@ -38,7 +39,7 @@ class DocumentGenerator:
         doc = Document()
         
         # Sort bidders by bid amount
-        sorted_bidders = sorted(bidders, key=lambda x: x['bid_amount'])
+        sorted_bidders = sorted(bidders, key=itemgetter('bid_amount'))
         
         # Get work details
         work_name = work['work_name']
@@ -196,7 +197,7 @@ class DocumentGenerator:
         doc = Document()
         
         # Sort bidders by bid amount
-        sorted_bidders = sorted(bidders, key=lambda x: x['bid_amount'])
+        sorted_bidders = sorted(bidders, key=itemgetter('bid_amount'))
         lowest_bidder = sorted_bidders[0]
         
         # Get work details
@@ -274,7 +275,7 @@ class DocumentGenerator:
         doc = Document()
         
         # Sort bidders and get L1
-        sorted_bidders = sorted(bidders, key=lambda x: x['bid_amount'])
+        sorted_bidders = sorted(bidders, key=itemgetter('bid_amount'))
         l1_bidder = sorted_bidders[0]
         
         # Get work details
@@ -361,7 +362,7 @@ class DocumentGenerator:
         doc = Document()
         
         # Sort bidders and get L1
-        sorted_bidders = sorted(bidders, key=lambda x: x['bid_amount'])
+        sorted_bidders = sorted(bidders, key=itemgetter('bid_amount'))
         l1_bidder = sorted_bidders[0]
         
         # Get work details
@@ -1,14 +1,28 @@
 import streamlit as st
 import traceback
 import functools
+import os
+import time
 from debug_logger import debug_logger
 
+# Upper bound for a single retry wait, in seconds
+MAX_RETRY_DELAY = 30
+
+@functools.lru_cache(maxsize=32)
+def _normalized_extensions(allowed_extensions):
+    """Lower-cased frozenset of an allowed-extensions tuple, built once per tuple"""
+    return frozenset(ext.lower() for ext in allowed_extensions)
+
 class ErrorHandler:
     """Comprehensive error handling system"""
     
     @staticmethod
     def handle_with_retry(max_retries=3, delay=1):
-        """Decorator for handling functions with retry logic"""
+        """Decorator for handling functions with retry logic
+        
+        Waits delay, 2*delay, 4*delay, ... seconds between attempts, capped at
+        MAX_RETRY_DELAY.
+        """
         def decorator(func):
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
@@ -18,9 +32,8 @@ class ErrorHandler:
                     except Exception as e:
                         debug_logger.log_error(e, f"Attempt {attempt + 1}/{max_retries} failed for {func.__name__}")
                         if attempt == max_retries - 1:
-                            raise e
-                        import time
-                        time.sleep(delay)
+                            raise
+                        time.sleep(min(delay * (1 << attempt), MAX_RETRY_DELAY))
                 return None
             return wrapper
         return decorator
@@ -39,16 +52,34 @@ class ErrorHandler:
                     st.code(traceback.format_exc(), language='python')
             return None
     
+    @staticmethod
+    def safe_execute_quiet(func):
+        """Run func, logging and swallowing any exception; no Streamlit output
+        
+        For batch and background code (validators, import loops) where the UI
+        calls made by safe_execute are wasted work.
+        """
+        try:
+            return func()
+        except Exception as e:
+            debug_logger.log_error(e, f"Safe execution failed: {getattr(func, '__name__', func)}")
+            return None
+    
     @staticmethod
     def validate_file_upload(uploaded_file, allowed_extensions=None, max_size_mb=10):
-        """Validate uploaded file"""
+        """Validate uploaded file
+        
+        allowed_extensions may be any iterable, e.g. a frozenset; a name
+        without an extension never matches.
+        """
         if uploaded_file is None:
             return False, "No file uploaded"
         
         # Check file extension
         if allowed_extensions:
-            file_extension = uploaded_file.name.split('.')[-1].lower()
-            if file_extension not in allowed_extensions:
+            allowed = _normalized_extensions(tuple(allowed_extensions))
+            file_extension = os.path.splitext(uploaded_file.name)[1].lstrip('.').lower()
+            if file_extension not in allowed:
                 return False, f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
         
         # Check file size
@@ -77,26 +108,21 @@ class ErrorHandler:
     @staticmethod
     def display_error_summary():
         """Display error summary in sidebar"""
-        if 'error_count' not in st.session_state:
-            st.session_state.error_count = 0
-        
-        if 'warning_count' not in st.session_state:
-            st.session_state.warning_count = 0
+        counters = debug_logger.session_counters()
         
         with st.sidebar:
-            if st.session_state.error_count > 0 or st.session_state.warning_count > 0:
+            if counters['error'] > 0 or counters['warning'] > 0:
                 st.markdown("---")
                 st.subheader("⚠️ Error Summary")
                 
-                if st.session_state.error_count > 0:
-                    st.error(f"Errors: {st.session_state.error_count}")
+                if counters['error'] > 0:
+                    st.error(f"Errors: {counters['error']}")
                 
-                if st.session_state.warning_count > 0:
-                    st.warning(f"Warnings: {st.session_state.warning_count}")
+                if counters['warning'] > 0:
+                    st.warning(f"Warnings: {counters['warning']}")
                 
                 if st.button("Reset Error Counters"):
-                    st.session_state.error_count = 0
-                    st.session_state.warning_count = 0
+                    counters['error'] = counters['warning'] = 0
                     st.rerun()
 
 error_handler = ErrorHandler()
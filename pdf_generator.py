@@ -2,7 +2,8 @@ import os
 import subprocess
 import logging
 import tempfile
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import shutil
 import re
 
@@ -14,6 +15,7 @@ class PDFGenerator:
     def __init__(self):
         self.output_dir = "outputs"
         self.temp_dir = "temp"
+        self.max_workers = 4
         self.ensure_directories()
     
     def ensure_directories(self):
@@ -80,51 +82,9 @@ class PDFGenerator:
             
             # Create temporary directory for compilation
             with tempfile.TemporaryDirectory(dir=self.temp_dir) as temp_compile_dir:
-                tex_filename = f"{filename_base}.tex"
-                pdf_filename = f"{filename_base}.pdf"
-                
-                tex_path = os.path.join(temp_compile_dir, tex_filename)
-                pdf_temp_path = os.path.join(temp_compile_dir, pdf_filename)
-                pdf_final_path = os.path.join(self.output_dir, pdf_filename)
-                
-                # Write LaTeX content to file
-                try:
-                    with open(tex_path, 'w', encoding='utf-8') as f:
-                        f.write(latex_content)
-                except Exception as e:
-                    return {
-                        'success': False,
-                        'error': f"Failed to write LaTeX file: {str(e)}"
-                    }
-                
-                # Compile PDF using available LaTeX engine
-                compile_result = self._compile_latex(tex_path, temp_compile_dir, latex_check['command'])
-                
-                if not compile_result['success']:
-                    return compile_result
-                
-                # Move PDF to output directory
-                if os.path.exists(pdf_temp_path):
-                    try:
-                        shutil.move(pdf_temp_path, pdf_final_path)
-                        logger.info(f"PDF generated successfully: {pdf_final_path}")
-                        
-                        return {
-                            'success': True,
-                            'pdf_path': pdf_final_path,
-                            'filename': pdf_filename,
-                            'size': os.path.getsize(pdf_final_path)
-                        }
-                    except Exception as e:
-                        return {
-                            'success': False,
-                            'error': f"Failed to move PDF to output directory: {str(e)}"
-                        }
-                else:
-                    return {
-                        'success': False,
-                        'error': "PDF file was not generated by LaTeX compilation"
-                    }
+                return self._compile_to_output(
+                    latex_content, filename_base, temp_compile_dir, latex_check['command']
+                )
                     
         except Exception as e:
             logger.error(f"Error generating PDF: {str(e)}")
@@ -132,7 +92,106 @@ class PDFGenerator:
                 'success': False,
                 'error': f"PDF generation failed: {str(e)}"
             }
-    
+
+    def generate_pdfs(self, documents: List[Tuple[str, str]],
+                      progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
+                      ) -> Dict[str, Dict[str, Any]]:
+        """Generate several PDFs in one batch from (latex_content, filename_base) pairs
+
+        Each statutory document is a standalone file with its own preamble, so the
+        engine still runs once per document; the batch checks the LaTeX
+        installation once and compiles the files concurrently in a single scratch
+        directory. Results are keyed by filename_base and have the same shape as
+        generate_pdf. progress_callback, if given, is called with
+        (filename_base, result) on the calling thread as each document finishes.
+        """
+        results = {}
+
+        try:
+            latex_check = self.check_latex_installation()
+            if not latex_check['installed']:
+                error = f"LaTeX not available: {latex_check.get('error', 'Unknown error')}"
+                for _, filename_base in documents:
+                    results[filename_base] = {
+                        'success': False,
+                        'error': error,
+                        'latex_check': latex_check
+                    }
+                return results
+
+            if not documents:
+                return results
+
+            with tempfile.TemporaryDirectory(dir=self.temp_dir) as temp_compile_dir:
+                # Compilation is subprocess-bound, so threads overlap the engine runs
+                max_workers = min(self.max_workers, len(documents))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(
+                            self._compile_to_output, latex_content, filename_base,
+                            temp_compile_dir, latex_check['command']
+                        ): filename_base
+                        for latex_content, filename_base in documents
+                    }
+                    for future in as_completed(futures):
+                        filename_base = futures[future]
+                        results[filename_base] = future.result()
+                        if progress_callback:
+                            progress_callback(filename_base, results[filename_base])
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Error generating PDF batch: {str(e)}")
+            for _, filename_base in documents:
+                results.setdefault(filename_base, {
+                    'success': False,
+                    'error': f"PDF generation failed: {str(e)}"
+                })
+            return results
+
+    def _compile_to_output(self, latex_content: str, filename_base: str,
+                           work_dir: str, latex_command: str) -> Dict[str, Any]:
+        """Write, compile and move a single document to the output directory"""
+        tex_path = os.path.join(work_dir, f"{filename_base}.tex")
+        pdf_filename = f"{filename_base}.pdf"
+        pdf_temp_path = os.path.join(work_dir, pdf_filename)
+        pdf_final_path = os.path.join(self.output_dir, pdf_filename)
+
+        try:
+            with open(tex_path, 'w', encoding='utf-8') as f:
+                f.write(latex_content)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f"Failed to write LaTeX file: {str(e)}"
+            }
+
+        compile_result = self._compile_latex(tex_path, work_dir, latex_command)
+        if not compile_result['success']:
+            return compile_result
+
+        if not os.path.exists(pdf_temp_path):
+            return {
+                'success': False,
+                'error': "PDF file was not generated by LaTeX compilation"
+            }
+
+        try:
+            shutil.move(pdf_temp_path, pdf_final_path)
+            logger.info(f"PDF generated successfully: {pdf_final_path}")
+            return {
+                'success': True,
+                'pdf_path': pdf_final_path,
+                'filename': pdf_filename,
+                'size': os.path.getsize(pdf_final_path)
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f"Failed to move PDF to output directory: {str(e)}"
+            }
+
     def _compile_latex(self, tex_path: str, work_dir: str, latex_command: str = 'pdflatex') -> Dict[str, Any]:
         """Compile LaTeX file to PDF using specified engine"""
         try:
@@ -1,4 +1,5 @@
 import logging
+from operator import itemgetter
 from typing import Dict, Any, List
 from datetime import datetime
 from date_utils import DateUtils
@@ -24,7 +25,7 @@ class ReportGenerator:
         """
         try:
             # Sort bidders by bid amount
-            sorted_bidders = sorted(bidders, key=lambda x: x['bid_amount'])
+            sorted_bidders = sorted(bidders, key=itemgetter('bid_amount'))
             
             # Get work details with date parsing
             work_name = work['work_name']
@@ -399,7 +400,7 @@ class ReportGenerator:
     def generate_summary_report(self, work: Dict[str, Any], bidders: List[Dict[str, Any]]) -> str:
         """Generate a concise summary report."""
         try:
-            sorted_bidders = sorted(bidders, key=lambda x: x['bid_amount'])
+            sorted_bidders = sorted(bidders, key=itemgetter('bid_amount'))
             lowest_bidder = sorted_bidders[0] if sorted_bidders else None
             
             work_info = work['work_info']
@@ -1,4 +1,5 @@
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, Any, List
 import logging
 from date_utils import DateUtils
@@ -79,7 +80,7 @@ class ScrutinySheetGenerator:
         
         try:
             # Sort bidders by bid amount (lowest first)
-            sorted_bidders = sorted(bidders, key=lambda x: x['bid_amount'])
+            sorted_bidders = sorted(bidders, key=itemgetter('bid_amount'))
             lowest_bidder = sorted_bidders[0]
             
             # Get work details
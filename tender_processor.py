@@ -1,28 +1,78 @@
 import logging
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Currency symbols and thousands separators stripped from numeric input
+# ('Rs.' is multi-character, so it is removed separately)
+_STRIP_TABLE = str.maketrans('', '', '₹,')
+
+
+def _build_required_check(required_fields, numeric_fields):
+    """Compile a straight-line required-field check for a fixed field table
+    
+    The returned function takes (data, unconverted) and returns the list of
+    "<Display Name> is required" errors, in table order. Numeric fields
+    listed in unconverted count as missing.
+    """
+    lines = ["def check_required(data, unconverted):", "    errors = []"]
+    for field, display_name in required_fields:
+        condition = f"not data.get({field!r})"
+        if field in numeric_fields:
+            condition += f" or {field!r} in unconverted"
+        lines.append(f"    if {condition}:")
+        lines.append(f"        errors.append({display_name + ' is required'!r})")
+    lines.append("    return errors")
+    
+    namespace = {}
+    exec(compile("\n".join(lines), "<tender required-field check>", "exec"), namespace)
+    return namespace['check_required']
+
+
 class TenderProcessor:
     """Process tender data and perform calculations"""
     
+    # Required fields and their display names, in reporting order
+    _REQUIRED_FIELDS = (
+        ('nit_number', 'NIT Number'),
+        ('work_name', 'Work Name'),
+        ('estimated_cost', 'Estimated Cost'),
+        ('earnest_money', 'Earnest Money'),
+        ('time_of_completion', 'Time of Completion'),
+    )
+    _NUMERIC_FIELDS = ('estimated_cost', 'schedule_amount', 'earnest_money', 'time_of_completion')
+    _TEXT_FIELDS = ('nit_number', 'work_name', 'ee_name')
+    # Labels indexed by how many thresholds are crossed
+    # (competition: 2 and 3 bidders; price spread: 10% and 20%)
+    _COMPETITION_LABELS = ('Low', 'Moderate', 'High')
+    _SPREAD_LABELS = ('Low variation in bids', 'Moderate variation in bids', 'High variation in bids')
+    # Numeric range checks: field -> (zero allowed, error message)
+    _RANGE_CHECKS = {
+        'estimated_cost': (False, "Estimated Cost must be positive"),
+        'earnest_money': (True, "Earnest Money cannot be negative"),
+        'time_of_completion': (False, "Time of Completion must be positive"),
+    }
+    
     def __init__(self):
         self.current_date = datetime.now()
+        self._processed_at = self.current_date.isoformat()
+        self._check_required = _build_required_check(self._REQUIRED_FIELDS, self._NUMERIC_FIELDS)
     
     def process_tender_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process and validate tender data"""
+        """Process and validate tender data
+        
+        raw_data is copied once here; the private helpers below update that
+        copy in place and return it.
+        """
         try:
-            processed_data = raw_data.copy()
-            
-            # Standardize data types
-            processed_data = self._standardize_data_types(processed_data)
-            
-            # Validate required fields
-            validation_result = self._validate_tender_data(processed_data)
-            if not validation_result['valid']:
-                processed_data['validation_errors'] = validation_result['errors']
+            # Standardize data types and validate in a single pass
+            processed_data, errors = self._standardize_and_validate(raw_data.copy())
+            if errors:
+                processed_data['validation_errors'] = errors
                 return processed_data
             
             # Calculate derived fields
@@ -35,100 +85,73 @@ class TenderProcessor:
             logger.error(f"Error processing tender data: {str(e)}")
             return raw_data
     
-    def _standardize_data_types(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Standardize data types for consistent processing"""
-        try:
-            standardized = data.copy()
-            
-            # Convert numeric fields
-            numeric_fields = [
-                'estimated_cost', 'schedule_amount', 'earnest_money', 
-                'time_of_completion'
-            ]
-            
-            for field in numeric_fields:
-                if field in standardized:
-                    try:
-                        value = standardized[field]
-                        if isinstance(value, str):
-                            # Remove currency symbols and commas
-                            value = value.replace('₹', '').replace(',', '').replace('Rs.', '').strip()
-                        
-                        if field == 'time_of_completion':
-                            standardized[field] = int(float(value))
-                        else:
-                            standardized[field] = float(value)
-                            
-                    except (ValueError, TypeError):
-                        logger.warning(f"Could not convert {field} to numeric: {standardized[field]}")
-            
-            # Standardize text fields
-            text_fields = ['nit_number', 'work_name', 'ee_name']
-            for field in text_fields:
-                if field in standardized and standardized[field]:
-                    standardized[field] = str(standardized[field]).strip()
-            
-            # Standardize date
-            if 'date' in standardized:
-                date_value = standardized['date']
-                if isinstance(date_value, str):
-                    standardized['date'] = date_value
-                else:
-                    standardized['date'] = str(date_value)
-            
-            return standardized
-            
-        except Exception as e:
-            logger.error(f"Error standardizing data types: {str(e)}")
-            return data
-    
-    def _validate_tender_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate tender data completeness and accuracy"""
-        errors = []
+    def _standardize_and_validate(self, data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """Standardize data types and collect validation errors (updates data in place)
         
-        # Required fields validation
-        required_fields = {
-            'nit_number': 'NIT Number',
-            'work_name': 'Work Name',
-            'estimated_cost': 'Estimated Cost',
-            'earnest_money': 'Earnest Money',
-            'time_of_completion': 'Time of Completion'
-        }
+        Range checks run right after each numeric conversion. Numeric fields
+        that cannot be converted are reported as missing, as in
+        process_tender_dataframe.
+        """
+        range_errors = []
+        unconverted = set()
         
-        for field, display_name in required_fields.items():
-            if field not in data or not data[field]:
-                errors.append(f"{display_name} is required")
+        # Convert numeric fields
+        for field in self._NUMERIC_FIELDS:
+            if field in data:
+                try:
+                    value = data[field]
+                    if isinstance(value, str):
+                        # Remove currency symbols and commas
+                        value = value.translate(_STRIP_TABLE).replace('Rs.', '').strip()
+                    
+                    if field == 'time_of_completion':
+                        value = int(float(value))
+                    else:
+                        value = float(value)
+                        
+                except (ValueError, TypeError):
+                    logger.warning(f"Could not convert {field} to numeric: {data[field]}")
+                    unconverted.add(field)
+                    continue
+                
+                data[field] = value
+                check = self._RANGE_CHECKS.get(field)
+                if check:
+                    allow_zero, message = check
+                    if value < 0 or (value == 0 and not allow_zero):
+                        range_errors.append(message)
         
-        # Numeric validations
-        if 'estimated_cost' in data and data['estimated_cost'] <= 0:
-            errors.append("Estimated Cost must be positive")
+        # Standardize text fields
+        for field in self._TEXT_FIELDS:
+            if field in data and data[field]:
+                data[field] = str(data[field]).strip()
         
-        if 'earnest_money' in data and data['earnest_money'] < 0:
-            errors.append("Earnest Money cannot be negative")
+        # Standardize date
+        if 'date' in data and not isinstance(data['date'], str):
+            data['date'] = str(data['date'])
         
-        if 'time_of_completion' in data and data['time_of_completion'] <= 0:
-            errors.append("Time of Completion must be positive")
+        # Required fields validation
+        errors = self._check_required(data, unconverted)
+        errors.extend(range_errors)
         
         # Business logic validations
-        if 'estimated_cost' in data and 'earnest_money' in data:
+        if ('estimated_cost' in data and 'earnest_money' in data
+                and not unconverted.intersection(('estimated_cost', 'earnest_money'))):
             estimated_cost = data['estimated_cost']
             earnest_money = data['earnest_money']
             
             # Typical earnest money is 1-5% of estimated cost
-            if earnest_money > 0:
+            if earnest_money > 0 and estimated_cost > 0:
                 percentage = (earnest_money / estimated_cost) * 100
                 if percentage < 0.5 or percentage > 10:
                     errors.append(f"Earnest Money ({percentage:.2f}% of estimated cost) seems unusual")
         
-        return {
-            'valid': len(errors) == 0,
-            'errors': errors
-        }
+        return data, errors
     
     def _calculate_derived_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Calculate derived fields from tender data"""
+        """Calculate derived fields from tender data (updates data in place)"""
         try:
-            calculated_data = data.copy()
+            calculated_data = data
             
             # Calculate earnest money percentage
             if 'estimated_cost' in data and 'earnest_money' in data and data['estimated_cost'] > 0:
@@ -140,7 +163,7 @@ class TenderProcessor:
                 calculated_data['schedule_amount'] = calculated_data.get('estimated_cost', 0)
             
             # Add processing timestamp
-            calculated_data['processed_at'] = self.current_date.isoformat()
+            calculated_data['processed_at'] = self._processed_at
             
             return calculated_data
             
@@ -148,6 +171,101 @@ class TenderProcessor:
             logger.error(f"Error calculating derived fields: {str(e)}")
             return data
     
+    def process_tender_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Process a DataFrame of tenders (one row per tender) with column operations
+        
+        Applies the same standardization, validation and derived fields as
+        process_tender_data. Adds a boolean 'valid' column and a
+        'validation_errors' column holding each row's error list; derived
+        fields are only filled in for valid rows. Values that cannot be
+        converted to numbers become NaN and are reported as missing.
+        """
+        processed = df.copy()
+        row_count = len(processed)
+        
+        # Convert numeric fields
+        for field in self._NUMERIC_FIELDS:
+            if field in processed:
+                column = processed[field]
+                if not pd.api.types.is_numeric_dtype(column):
+                    column = column.astype(str).str.translate(_STRIP_TABLE).str.replace('Rs.', '', regex=False).str.strip()
+                processed[field] = pd.to_numeric(column, errors='coerce')
+        
+        if 'time_of_completion' in processed:
+            processed['time_of_completion'] = np.trunc(processed['time_of_completion']).astype('Int64')
+        
+        # Standardize text fields
+        for field in self._TEXT_FIELDS:
+            if field in processed:
+                column = processed[field]
+                present = column.notna() & column.astype(bool)
+                processed.loc[present, field] = column[present].astype(str).str.strip()
+        
+        # Standardize date
+        if 'date' in processed:
+            present = processed['date'].notna()
+            processed.loc[present, 'date'] = processed.loc[present, 'date'].astype(str)
+        
+        # Build validation masks in the same order as _standardize_and_validate
+        checks = []
+        for field, display_name in self._REQUIRED_FIELDS:
+            if field in processed:
+                column = processed[field]
+                missing = column.isna() | ~column.fillna(0).astype(bool)
+            else:
+                missing = pd.Series(True, index=processed.index)
+            checks.append((missing, f"{display_name} is required"))
+        
+        estimated_cost = processed.get('estimated_cost')
+        earnest_money = processed.get('earnest_money')
+        
+        if estimated_cost is not None:
+            checks.append((estimated_cost <= 0, "Estimated Cost must be positive"))
+        if earnest_money is not None:
+            checks.append((earnest_money < 0, "Earnest Money cannot be negative"))
+        if 'time_of_completion' in processed:
+            checks.append((processed['time_of_completion'].fillna(1) <= 0, "Time of Completion must be positive"))
+        
+        earnest_percentage = None
+        if estimated_cost is not None and earnest_money is not None:
+            # Typical earnest money is 1-5% of estimated cost
+            earnest_percentage = earnest_money / estimated_cost * 100
+            unusual = (earnest_money > 0) & (estimated_cost > 0) & ((earnest_percentage < 0.5) | (earnest_percentage > 10))
+            checks.append((unusual, earnest_percentage))
+        
+        # Only rows that fail a check pay for building error strings
+        errors: List[List[str]] = [[] for _ in range(row_count)]
+        for mask, message in checks:
+            for position in np.flatnonzero(mask.fillna(False).to_numpy(dtype=bool)):
+                if isinstance(message, str):
+                    errors[position].append(message)
+                else:
+                    errors[position].append(
+                        f"Earnest Money ({message.iat[position]:.2f}% of estimated cost) seems unusual"
+                    )
+        
+        valid = pd.Series([not row_errors for row_errors in errors], index=processed.index, dtype=bool)
+        processed['valid'] = valid
+        processed['validation_errors'] = errors
+        
+        # Calculate derived fields for valid rows
+        if earnest_percentage is not None:
+            processed['earnest_money_percentage'] = earnest_percentage.round(2).where(valid & (estimated_cost > 0))
+        
+        if estimated_cost is not None:
+            if 'schedule_amount' in processed:
+                schedule_missing = processed['schedule_amount'].isna() | (processed['schedule_amount'] == 0)
+            else:
+                processed['schedule_amount'] = np.nan
+                schedule_missing = pd.Series(True, index=processed.index)
+            fill = valid & schedule_missing
+            processed.loc[fill, 'schedule_amount'] = estimated_cost[fill]
+        
+        processed['processed_at'] = pd.Series(self._processed_at, index=processed.index).where(valid)
+        
+        logger.info(f"Processed {row_count} tenders ({int(valid.sum())} valid)")
+        return processed
+    
     def process_bidder_data(self, bidders: List[Dict[str, Any]], estimated_cost: float) -> Dict[str, Any]:
         """Process and analyze bidder data"""
         try:
@@ -164,8 +282,11 @@ class TenderProcessor:
                 if processed_bidder:
                     processed_bidders.append(processed_bidder)
             
-            # Sort by bid amount (lowest first)
-            processed_bidders.sort(key=lambda x: x['bid_amount'])
+            # Sort by bid amount (lowest first) with a stable argsort over the amounts
+            amounts = np.fromiter((b['bid_amount'] for b in processed_bidders),
+                                  dtype=np.float64, count=len(processed_bidders))
+            order = np.argsort(amounts, kind='stable')
+            processed_bidders = [processed_bidders[i] for i in order]
             
             # Add rank information
             for rank, bidder in enumerate(processed_bidders, 1):
@@ -188,47 +309,49 @@ class TenderProcessor:
             }
     
     def _process_single_bidder(self, bidder: Dict[str, Any], estimated_cost: float, serial: int) -> Optional[Dict[str, Any]]:
-        """Process a single bidder's data"""
+        """Process a single bidder's data
+        
+        Called once per bidder, so each input field is read once into a
+        local and the percentage is converted to float a single time.
+        """
         try:
-            processed = bidder.copy()
-            
             # Validate required fields
-            if not bidder.get('name', '').strip():
+            name = bidder.get('name', '').strip()
+            if not name:
                 logger.warning(f"Bidder {serial}: Name is required")
                 return None
             
-            # Standardize name
-            processed['name'] = bidder['name'].strip()
-            
             # Process percentage
             percentage = bidder.get('percentage', 0)
             if isinstance(percentage, str):
                 try:
                     percentage = float(percentage.replace('%', '').strip())
                 except ValueError:
-                    percentage = 0
-            
-            processed['percentage'] = float(percentage)
+                    percentage = 0.0
+            else:
+                percentage = float(percentage)
             
             # Calculate bid amount
-            if 'bid_amount' not in processed or not processed['bid_amount']:
-                bid_amount = estimated_cost * (1 + percentage / 100)
-                processed['bid_amount'] = round(bid_amount, 2)
+            bid_amount = bidder.get('bid_amount')
+            if bid_amount:
+                bid_amount = float(bid_amount)
             else:
-                processed['bid_amount'] = float(processed['bid_amount'])
+                bid_amount = round(estimated_cost * (1 + percentage / 100), 2)
             
             # Format percentage display
             if percentage > 0:
-                processed['percentage_display'] = f"{percentage:.2f}% ABOVE"
+                percentage_display = f"{percentage:.2f}% ABOVE"
             elif percentage < 0:
-                processed['percentage_display'] = f"{abs(percentage):.2f}% BELOW"
+                percentage_display = f"{-percentage:.2f}% BELOW"
             else:
-                processed['percentage_display'] = "AT ESTIMATE"
+                percentage_display = "AT ESTIMATE"
             
-            # Add serial number
+            processed = bidder.copy()
+            processed['name'] = name
+            processed['percentage'] = percentage
+            processed['bid_amount'] = bid_amount
+            processed['percentage_display'] = percentage_display
             processed['serial'] = serial
-            
-            # Standardize contact
             processed['contact'] = str(bidder.get('contact', '')).strip()
             
             return processed
@@ -243,16 +366,31 @@ class TenderProcessor:
             if not bidders:
                 return {'error': 'No valid bidders to analyze'}
             
-            bid_amounts = [b['bid_amount'] for b in bidders]
-            percentages = [b['percentage'] for b in bidders]
+            # Collect bid statistics and the distribution in a single pass
+            count = len(bidders)
+            lowest, highest, total = float('inf'), float('-inf'), 0.0
+            above_estimate = below_estimate = 0
+            for bidder in bidders:
+                amount = bidder['bid_amount']
+                total += amount
+                if amount < lowest:
+                    lowest = amount
+                if amount > highest:
+                    highest = amount
+                percentage = bidder['percentage']
+                if percentage > 0:
+                    above_estimate += 1
+                elif percentage < 0:
+                    below_estimate += 1
             
             analysis = {
-                'total_bidders': len(bidders),
-                'lowest_bid': min(bid_amounts),
-                'highest_bid': max(bid_amounts),
-                'average_bid': sum(bid_amounts) / len(bid_amounts),
-                'bid_range': max(bid_amounts) - min(bid_amounts),
-                'lowest_bidder': bidders[0],  # Already sorted by bid amount
+                'total_bidders': count,
+                'lowest_bid': lowest,
+                'highest_bid': highest,
+                'average_bid': total / count,
+                'bid_range': highest - lowest,
+                # Already sorted by bid amount; keep only what recommendations use
+                'lowest_bidder': {'name': bidders[0]['name'], 'bid_amount': bidders[0]['bid_amount']},
             }
             
             # Calculate savings/excess
@@ -267,9 +405,7 @@ class TenderProcessor:
                 analysis['is_saving'] = False
             
             # Bidder distribution analysis
-            above_estimate = len([p for p in percentages if p > 0])
-            below_estimate = len([p for p in percentages if p < 0])
-            at_estimate = len([p for p in percentages if p == 0])
+            at_estimate = count - above_estimate - below_estimate
             
             analysis['bidder_distribution'] = {
                 'above_estimate': above_estimate,
@@ -278,24 +414,13 @@ class TenderProcessor:
             }
             
             # Competition analysis
-            if len(bidders) >= 3:
-                analysis['competition_level'] = 'High'
-            elif len(bidders) == 2:
-                analysis['competition_level'] = 'Moderate'
-            else:
-                analysis['competition_level'] = 'Low'
+            analysis['competition_level'] = self._COMPETITION_LABELS[(count >= 2) + (count >= 3)]
             
             # Price spread analysis
             if analysis['bid_range'] > 0:
                 spread_percentage = (analysis['bid_range'] / analysis['average_bid']) * 100
                 analysis['price_spread_percentage'] = spread_percentage
-                
-                if spread_percentage > 20:
-                    analysis['spread_analysis'] = 'High variation in bids'
-                elif spread_percentage > 10:
-                    analysis['spread_analysis'] = 'Moderate variation in bids'
-                else:
-                    analysis['spread_analysis'] = 'Low variation in bids'
+                analysis['spread_analysis'] = self._SPREAD_LABELS[(spread_percentage > 10) + (spread_percentage > 20)]
             
             return analysis
             
@@ -309,37 +434,56 @@ class TenderProcessor:
             if 'error' in analysis:
                 return f"Unable to generate recommendation: {analysis['error']}"
             
-            recommendations = []
-            
-            # Lowest bidder recommendation
+            # Reduce the analysis to the values the text depends on
             lowest_bidder = analysis.get('lowest_bidder', {})
+            lowest = None
             if lowest_bidder:
-                name = lowest_bidder.get('name', 'Unknown')
-                amount = lowest_bidder.get('bid_amount', 0)
-                recommendations.append(f"Lowest bidder: {name} with bid amount ₹{amount:,.2f}")
-            
-            # Savings/excess analysis
-            if analysis.get('is_saving'):
-                savings = analysis.get('savings', 0)
-                savings_pct = analysis.get('savings_percentage', 0)
-                recommendations.append(f"Project will save ₹{savings:,.2f} ({savings_pct:.2f}% below estimate)")
-            else:
-                excess = analysis.get('excess', 0)
-                excess_pct = analysis.get('excess_percentage', 0)
-                recommendations.append(f"Project will cost ₹{excess:,.2f} extra ({excess_pct:.2f}% above estimate)")
-            
-            # Competition analysis
-            competition = analysis.get('competition_level', 'Unknown')
-            total_bidders = analysis.get('total_bidders', 0)
-            recommendations.append(f"Competition level: {competition} ({total_bidders} bidders)")
+                lowest = (lowest_bidder.get('name', 'Unknown'), lowest_bidder.get('bid_amount', 0))
             
-            # Price spread analysis
-            spread_analysis = analysis.get('spread_analysis')
-            if spread_analysis:
-                recommendations.append(f"Price analysis: {spread_analysis}")
+            is_saving = bool(analysis.get('is_saving'))
+            if is_saving:
+                difference = analysis.get('savings', 0)
+                difference_pct = analysis.get('savings_percentage', 0)
+            else:
+                difference = analysis.get('excess', 0)
+                difference_pct = analysis.get('excess_percentage', 0)
             
-            return ". ".join(recommendations) + "."
+            key = (
+                lowest, is_saving, difference, difference_pct,
+                analysis.get('competition_level', 'Unknown'),
+                analysis.get('total_bidders', 0),
+                analysis.get('spread_analysis'),
+            )
+            return _generate_recommendation_cached(key)
             
         except Exception as e:
             logger.error(f"Error generating recommendation: {str(e)}")
             return "Unable to generate recommendation due to processing error."
+
+
+@lru_cache(maxsize=256)
+def _generate_recommendation_cached(key: Tuple) -> str:
+    """Build the recommendation text for a key from generate_recommendation"""
+    lowest, is_saving, difference, difference_pct, competition, total_bidders, spread_analysis = key
+    recommendations = []
+    
+    # Lowest bidder recommendation
+    if lowest:
+        name, amount = lowest
+        recommendations.append(f"Lowest bidder: {name} with bid amount ₹{amount:,.2f}.")
+    
+    # Savings/excess analysis
+    if is_saving:
+        recommendations.append(f"Project will save ₹{difference:,.2f} ({difference_pct:.2f}% below estimate).")
+    else:
+        recommendations.append(f"Project will cost ₹{difference:,.2f} extra ({difference_pct:.2f}% above estimate).")
+    
+    # Competition analysis
+    recommendations.append(f"Competition level: {competition} ({total_bidders} bidders).")
+    
+    # Price spread analysis
+    if spread_analysis:
+        recommendations.append(f"Price analysis: {spread_analysis}.")
+    
+    # Each sentence carries its own full stop, so one join builds the text
+    return " ".join(recommendations)
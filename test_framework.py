@@ -459,7 +459,7 @@ class TestFramework:
             st.session_state.debug_mode = debug_mode
             
             if st.button("Clear Debug Logs"):
-                debug_logger.setup_logging()  # Reinitialize logging
+                debug_logger.clear_logs()
                 st.success("Debug logs cleared!")
             
             if st.button("Export Debug Info"):
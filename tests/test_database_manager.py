@@ -0,0 +1,41 @@
+import pytest
+
+from database_manager import DatabaseManager
+
+
+def _work(nit_number):
+    return {
+        'nit_number': nit_number,
+        'work_name': 'Road repair',
+        'estimated_cost': 100000.0,
+        'bidders': [{'name': 'A', 'percentage': -5.0, 'bid_amount': 95000.0, 'contact': ''}],
+    }
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "test.db"))
+    yield manager
+    manager.close()
+
+
+def test_transaction_commits_batch(db):
+    with db.transaction() as cur:
+        db.save_work_data(_work('N1'), cursor=cur)
+        db.save_work_data(_work('N2'), cursor=cur)
+    
+    assert len(db.get_all_works()) == 2
+
+
+def test_read_inside_transaction_does_not_commit_batch(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction() as cur:
+            db.save_work_data(_work('N1'), cursor=cur)
+            # A duplicate check made mid-batch sees the pending row...
+            assert db.get_work_by_nit('N1')['nit_number'] == 'N1'
+            db.save_work_data(_work('N2'), cursor=cur)
+            raise RuntimeError("abort import")
+    
+    # ...but must not have committed it
+    assert db.get_work_by_nit('N1') is None
+    assert db.get_all_works() == []
@@ -0,0 +1,18 @@
+import pytest
+
+from latex_report_generator import LatexReportGenerator
+
+
+@pytest.fixture
+def generator():
+    return LatexReportGenerator()
+
+
+@pytest.mark.parametrize("amount, words", [
+    (99999999, "Nine Crore Ninety Nine Lakh Ninety Nine Thousand Nine Hundred Ninety Nine Rupees Only"),
+    (10**10, "One Thousand Crore Rupees Only"),
+    (2 * 10**10, "Two Thousand Crore Rupees Only"),
+    (2 * 10**10 + 500000, "Two Thousand Crore Five Lakh Rupees Only"),
+])
+def test_number_to_words_large_crore_amounts(generator, amount, words):
+    assert generator._number_to_words(amount) == words
@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+from tender_processor import TenderProcessor
+
+TENDERS = [
+    {'nit_number': ' NIT/01 ', 'work_name': 'Road repair', 'estimated_cost': '₹1,00,000',
+     'earnest_money': 2000, 'time_of_completion': '6'},
+    {'nit_number': 'NIT/02', 'work_name': 'Drain', 'estimated_cost': 'Rs. 50000',
+     'earnest_money': '100', 'time_of_completion': 3, 'schedule_amount': 45000},
+    {'nit_number': 'NIT/03', 'work_name': '', 'estimated_cost': 'n/a',
+     'earnest_money': 500, 'time_of_completion': 4},
+    {'nit_number': 'NIT/04', 'work_name': 'Culvert', 'estimated_cost': -10,
+     'earnest_money': -1, 'time_of_completion': 0},
+    {'nit_number': 'NIT/05', 'work_name': 'Bridge', 'estimated_cost': 0,
+     'earnest_money': 0, 'time_of_completion': '2.7'},
+]
+
+
+@pytest.fixture
+def processor():
+    return TenderProcessor()
+
+
+def test_dataframe_validation_matches_per_dict(processor):
+    expected = [processor.process_tender_data(tender) for tender in TENDERS]
+    processed = processor.process_tender_dataframe(pd.DataFrame(TENDERS))
+    
+    assert processed['valid'].tolist() == ['validation_errors' not in row for row in expected]
+    assert processed['validation_errors'].tolist() == [row.get('validation_errors', []) for row in expected]
+
+
+def test_dataframe_derived_fields_match_per_dict(processor):
+    expected = [processor.process_tender_data(tender) for tender in TENDERS]
+    processed = processor.process_tender_dataframe(pd.DataFrame(TENDERS))
+    
+    for position, row in enumerate(expected):
+        if 'validation_errors' in row:
+            continue
+        for field in ('estimated_cost', 'earnest_money', 'time_of_completion',
+                      'schedule_amount', 'earnest_money_percentage', 'processed_at'):
+            assert processed[field].iat[position] == row[field], field
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Dict, Any, List
 import logging
 from date_utils import DateUtils
@@ -93,7 +94,7 @@ class WorkOrderGenerator:
         
         try:
             # Sort bidders by bid amount (lowest first)
-            sorted_bidders = sorted(bidders, key=lambda x: x['bid_amount'])
+            sorted_bidders = sorted(bidders, key=itemgetter('bid_amount'))
             lowest_bidder = sorted_bidders[0]
             
             # Get work details